@@ -15,31 +15,42 @@ Assumes the following classes are already available:
 from __future__ import annotations
 import re
 import json
-from typing import Dict, List, Optional
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Optional
 
 from csp_cop_src.solutions.job_shop_scheduling_solution import JobShopSchedulingSolution, ScheduledTask
 
+# google-re2 matches in linear time, so nested quantifiers below cannot blow
+# up on adversarial model output. Fall back to `re` when it is not installed.
+# Flags are written inline because re2 does not accept `re.I` / `re.M`.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
 
 # ───────────────────────────────────────────────────────────────────────────────
 #  Regex helpers
 # ───────────────────────────────────────────────────────────────────────────────
 
-RE_NOT_FEASIBLE = re.compile(r'\bnot\s+feasible\b', re.I)
+RE_NOT_FEASIBLE = _re_engine.compile(r'(?i)\bnot\s+feasible\b')
+RE_OPTIMAL = _re_engine.compile(r'(?i)\boptimal\b')
+RE_DIGITS = _re_engine.compile(r'\d+')
 
-RE_MAKESPAN_LINE = re.compile(r'makespan[^0-9]*?(\d+)', re.I)          # Tier A
-RE_STANDALONE_INT = re.compile(r'^\D*(\d+)\D*$', re.M)                 # Tier B
-RE_MAKESPAN_JSON = re.compile(r'"optimal_makespan"\s*:\s*(\d+)', re.I) # Tier C
+RE_MAKESPAN_LINE = _re_engine.compile(r'(?i)makespan[^0-9]*?(\d+)')          # Tier A
+RE_STANDALONE_INT = _re_engine.compile(r'(?m)^\D*(\d+)\D*$')                 # Tier B
+RE_MAKESPAN_JSON = _re_engine.compile(r'(?i)"optimal_makespan"\s*:\s*(\d+)') # Tier C
 
-RE_JOB_CANON = re.compile(r'^job\s+(\d+)\s*[:\-]\s*(.*)$', re.I)
-RE_TASK_CANON = re.compile(
-    r'm(?:achine)?[_\s-]?(\d+)\s*,?\s*(\d+)\s*,?\s*(\d+)', re.I
+RE_JOB_CANON = _re_engine.compile(r'(?i)^job\s+(\d+)\s*[:\-]\s*(.*)$')
+RE_TASK_CANON = _re_engine.compile(
+    r'(?i)m(?:achine)?[_\s-]?(\d+)\s*,?\s*(\d+)\s*,?\s*(\d+)'
 )
 
 # Loose: <job_id> <m> <s> <e> [<m> <s> <e>]…
-RE_JOB_LOOSE = re.compile(r'\b(\d+)(?:\D+(\d+)\D+(\d+)\D+(\d+))+')
+RE_JOB_LOOSE = _re_engine.compile(r'\b(\d+)(?:\D+(\d+)\D+(\d+)\D+(\d+))+')
 
 # Table row: 4+ integers, first changes only at row breaks
-RE_TABLE_ROW = re.compile(r'(?:\d+\D+){3,}\d+')
+RE_TABLE_ROW = _re_engine.compile(r'(?:\d+\D+){3,}\d+')
 
 
 # ───────────────────────────────────────────────────────────────────────────────
@@ -69,13 +80,23 @@ def _safe_int(x: str) -> Optional[int]:
 #  Makespan detection
 # ───────────────────────────────────────────────────────────────────────────────
 
-def _find_makespan(txt: str) -> Optional[int]:
+def _tail_window(lines: List[str]) -> str:
+    """
+    Last 5 lines of the answer, reusing the caller's split and skipping
+    trailing blank lines the way txt.strip() did.
+    """
+    end = len(lines)
+    while end and not lines[end - 1].strip():
+        end -= 1
+    return '\n'.join(lines[max(0, end - 5):end])
+
+
+def _find_makespan(txt: str, tail: str) -> Optional[int]:
     # Tier A: explicit “Makespan …”
     if m := RE_MAKESPAN_LINE.search(txt):
         return int(m.group(1))
 
     # Tier B: stand-alone number lines near the tail (≤5 lines)
-    tail = '\n'.join(txt.strip().splitlines()[-5:])
     if m := RE_STANDALONE_INT.search(tail):
         return int(m.group(1))
 
@@ -90,43 +111,53 @@ def _find_makespan(txt: str) -> Optional[int]:
 #  Schedule extraction strategies
 # ───────────────────────────────────────────────────────────────────────────────
 
-def _parse_canonical(lines: List[str]) -> Optional[Dict[int, List[ScheduledTask]]]:
-    schedule: Dict[int, List[ScheduledTask]] = {}
-    for ln in lines:
-        jmatch = RE_JOB_CANON.match(ln.strip())
-        if not jmatch:
-            continue
-        jid = int(jmatch.group(1))
-        task_part = jmatch.group(2)
-        triples = [
-            tuple(map(int, t))
-            for t in RE_TASK_CANON.findall(task_part)
-        ]
-        if triples:
-            schedule[jid] = _build_tasks(triples)
-
-    return schedule or None
-
+def _scan_schedule(
+    lines: List[str],
+) -> tuple[Dict[int, List[tuple[int, int, int]]], ...]:
+    """
+    Walk `lines` once and collect candidates for every line-based strategy.
 
-def _parse_loose(lines: List[str]) -> Optional[Dict[int, List[ScheduledTask]]]:
-    # Consider only last 10 lines
-    schedule: Dict[int, List[ScheduledTask]] = {}
-    for ln in lines[-10:]:
-        nums = list(map(int, re.findall(r'\d+', ln)))
-        if len(nums) < 4:
-            continue
-        jid, rest = nums[0], nums[1:]
-        if (len(rest) % 3) != 0:
+    Returns ``(canonical, loose, table)`` as job-id → (m, s, e) triples
+    dicts; a strategy that matched nothing yields an empty dict.
+      • canonical: ``Job <i>: (machine_<m>, <s>, <e>), …`` lines
+      • loose:     ``<job_id> <m> <s> <e> [<m> <s> <e>]…`` in the last 10 lines
+      • table:     rows of 4+ integers read as job, machine, start, end
+    """
+    canonical: Dict[int, List[tuple[int, int, int]]] = {}
+    loose: Dict[int, List[tuple[int, int, int]]] = {}
+    table: DefaultDict[int, List[tuple[int, int, int]]] = defaultdict(list)
+    loose_start = len(lines) - 10
+
+    for i, ln in enumerate(lines):
+        if jmatch := RE_JOB_CANON.match(ln.strip()):
+            triples = [
+                tuple(map(int, t))
+                for t in RE_TASK_CANON.findall(jmatch.group(2))
+            ]
+            if triples:
+                canonical[int(jmatch.group(1))] = triples
+
+        # Count digit runs before converting, most prose lines have fewer than 4
+        digits = RE_DIGITS.findall(ln)
+        if len(digits) < 4:
             continue
-        triples = [tuple(rest[i:i+3]) for i in range(0, len(rest), 3)]
-        schedule[jid] = _build_tasks(triples)
+        jid, *rest = map(int, digits)
+        table[jid].append(tuple(rest[:3]))
+        if i >= loose_start and (len(rest) % 3) == 0:
+            # Group into (m, s, e) by zipping one iterator with itself, no slices
+            loose[jid] = list(zip(*[iter(rest)] * 3))
 
-    return schedule or None
+    return canonical, loose, table
 
 
 def _parse_json(txt: str) -> Optional[Dict[int, List[ScheduledTask]]]:
+    # find/rfind instead of index/rindex: most answers have no JSON at all and
+    # should not pay for raising and catching a ValueError
+    start, end = txt.find('{'), txt.rfind('}')
+    if start == -1 or end < start:
+        return None
     try:
-        blob = json.loads(txt[txt.index('{'): txt.rindex('}') + 1])
+        blob = json.loads(txt[start: end + 1])
     except Exception:
         return None
 
@@ -144,34 +175,14 @@ def _parse_json(txt: str) -> Optional[Dict[int, List[ScheduledTask]]]:
     return schedule
 
 
-def _parse_table(lines: List[str]) -> Optional[Dict[int, List[ScheduledTask]]]:
-    rows = [ln for ln in lines if RE_TABLE_ROW.search(ln)]
-    if not rows:
-        return None
-
-    schedule: Dict[int, List[ScheduledTask]] = {}
-    for ln in rows:
-        nums = list(map(int, re.findall(r'\d+', ln)))
-        if len(nums) < 4:
-            continue
-        # Assume format: job, machine, start, end
-        jid, m, s, e = nums[:4]
-        schedule.setdefault(jid, []).append((int(m), int(s), int(e)))
-
-    # Convert triples → ScheduledTask
-    if schedule:
-        for jid, triples in schedule.items():
-            schedule[jid] = _build_tasks(triples)
-        return schedule
-    return None
-
-
 # ───────────────────────────────────────────────────────────────────────────────
 #  Decide status
 # ───────────────────────────────────────────────────────────────────────────────
 
-def _decide_status(txt: str, makespan: Optional[int]) -> str:
-    if makespan is not None and re.search(r'\boptimal\b', txt, re.I):
+def _decide_status(tail: str, makespan: Optional[int]) -> str:
+    # Only the closing lines are checked: "optimal" earlier in the answer is
+    # usually reasoning ("find the optimal schedule"), not a claim
+    if makespan is not None and RE_OPTIMAL.search(tail):
         return 'OPTIMAL'
     if makespan is not None:
         return 'FEASIBLE'
@@ -201,21 +212,28 @@ def parse_job_shop(
             schedule={}
         )
 
+    lines = txt.splitlines()
+    tail = _tail_window(lines)
+
     # 1. Makespan (optional)
-    makespan = _find_makespan(txt)
+    makespan = _find_makespan(txt, tail)
 
     # 2. Try to parse a schedule
-    lines = txt.splitlines()
 
-    parsers = (_parse_canonical, _parse_loose, _parse_json, _parse_table)
+    # Strategy priority: canonical, loose, JSON, table
+    canonical, loose, table = _scan_schedule(lines)
     schedule: Optional[Dict[int, List[ScheduledTask]]] = None
-    for p in parsers:
-        schedule = p(lines if p is not _parse_json else txt)  # type: ignore[arg-type]
-        if schedule:
-            break
-
-    if schedule is None:
-        return None
+    if canonical or loose:
+        triples_by_job = canonical or loose
+    else:
+        schedule = _parse_json(txt)
+        triples_by_job = table
+    if not schedule:
+        if not triples_by_job:
+            return None
+        schedule = {
+            jid: _build_tasks(triples) for jid, triples in triples_by_job.items()
+        }
 
     # 3. Fill in missing makespan
     if makespan is None:
@@ -224,7 +242,7 @@ def parse_job_shop(
         )
 
     # 4. Status
-    status = _decide_status(txt, makespan)
+    status = _decide_status(tail, makespan)
 
     # 5. Build and return solution
     return JobShopSchedulingSolution(
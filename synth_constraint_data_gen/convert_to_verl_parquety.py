@@ -1,33 +1,58 @@
 import argparse
 import json
+import os
 import re
 from pathlib import Path
 
-import datasets
+# orjson encodes/decodes in C; fall back to the stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+if orjson is not None:
+    _json_loads = orjson.loads
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _json_loads = json.loads
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
 
-def load_csvs_to_dataset(path: Path):
+
+# datasets builder name for each supported split file extension
+SPLIT_FILE_BUILDERS = {
+    ".parquet": "parquet",
+    ".csv": "csv",
+}
+
+
+def load_splits_to_dataset(path: Path):
     """
-    Loads each CSV file in a given path into a pandas DataFrame and stores them
-    in a dictionary where the key is the basename of the filename (without extension).
+    Loads each Parquet or CSV split file in a given path into a datasets.Dataset and
+    stores them in a dictionary where the key is the basename of the filename (without extension).
 
     Args:
-        path (Path): The directory path containing the CSV files.
+        path (Path): The directory path containing the split files.
 
     Returns:
-        dict: A dictionary where keys are CSV basenames and values are pandas DataFrames.
-              Returns an empty dictionary if no CSV files are found or the path is invalid.
+        dict: A dictionary where keys are file basenames and values are datasets.Dataset objects.
+              Returns an empty dictionary if no split files are found.
     """
+    import datasets # Deferred so argparse errors and --help stay fast
+
     raw_datasets = {}
     if not path.is_dir(): # Replaced os.path.isdir with Path.is_dir()
         raise ValueError(f"Error: Path '{path}' is not a valid directory.")
 
-    # Replaced os.listdir and os.path.join with Path.glob for elegance
-    for filepath in path.glob("*.csv"):
+    for filepath in sorted(path.iterdir()):
+        builder = SPLIT_FILE_BUILDERS.get(filepath.suffix)
+        if builder is None:
+            continue
         basename = filepath.stem # Replaced os.path.splitext with Path.stem
         try:
             # datasets.load_dataset expects a string path, so convert Path object to string
-            raw_datasets[basename] = datasets.load_dataset("csv", data_files=str(filepath))['train']
+            raw_datasets[basename] = datasets.load_dataset(builder, data_files=str(filepath))['train']
         except Exception as e:
             print(f"Error loading '{filepath.name}': {e}") # Replaced os.path.basename with Path.name
     return raw_datasets
@@ -37,12 +62,14 @@ if __name__ == '__main__':
     # Changed type to lambda p: Path(p).expanduser() to read arguments as Path objects and handle '~'
     parser.add_argument('--dataset_dir', type=lambda p: Path(p).expanduser(), default='~/data/gsm8k')
     parser.add_argument('--output_dir', type=lambda p: Path(p).expanduser() if p else None, default=None)
+    parser.add_argument('--num_proc', type=int, default=os.cpu_count())
+    parser.add_argument('--batch_size', type=int, default=1024)
 
 
     args = parser.parse_args()
 
     # args.dataset_dir is now a Path object
-    raw_datasets = load_csvs_to_dataset(args.dataset_dir)
+    raw_datasets = load_splits_to_dataset(args.dataset_dir)
 
     # If output_dir is provided, ensure the directory exists
     if args.output_dir:
@@ -50,35 +77,53 @@ if __name__ == '__main__':
 
     # add a row to each data item that represents a unique id
     def make_map_fn(split):
-        def process_fn(example, idx):
-            example_solution = json.loads(example['example_solution'])
-            problem = json.loads(example['problem'])
+        # Batched: `examples` maps column name -> list of values, one call per batch
+        def process_fn(examples, indices):
+            ground_truths = [
+                _json_dumps({
+                    'example_solution': _json_loads(example_solution),
+                    'problem': _json_loads(problem)
+                })
+                for example_solution, problem in zip(examples['example_solution'], examples['problem'])
+            ]
 
             data = {
-                "data_source": 'jsp_full',
-                "prompt": [{
-                    "role": "user",
-                    "content": example['prompt']
-                }],
-                "ability": "math",
-                "reward_model": {
-                    "style": "rule",
-                    "ground_truth": json.dumps({
-                        'example_solution': example_solution,
-                        'problem': problem
-                    })
-                },
-                "extra_info": {
-                    'split': split,
-                    'index': idx
-                }
+                "data_source": ['jsp_full'] * len(indices),
+                "prompt": [
+                    [{
+                        "role": "user",
+                        "content": prompt
+                    }]
+                    for prompt in examples['prompt']
+                ],
+                "ability": ["math"] * len(indices),
+                "reward_model": [
+                    {
+                        "style": "rule",
+                        "ground_truth": ground_truth
+                    }
+                    for ground_truth in ground_truths
+                ],
+                "extra_info": [
+                    {
+                        'split': split,
+                        'index': idx
+                    }
+                    for idx in indices
+                ]
             }
             return data
 
         return process_fn
 
     for split, dataset in raw_datasets.items():
-        mapped_dataset = dataset.map(function=make_map_fn(split), with_indices=True)
+        mapped_dataset = dataset.map(
+            function=make_map_fn(split),
+            with_indices=True,
+            batched=True,
+            batch_size=args.batch_size,
+            num_proc=args.num_proc,
+        )
         if args.output_dir:
             mapped_dataset.to_parquet(args.output_dir / f'{split}.parquet')
         else:
@@ -1,24 +1,58 @@
 import argparse
-import yaml
 import random
 import uuid
 import warnings
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar, List, Optional, Dict, Any, Tuple
 import copy
-import pandas as pd
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 from csp_cop_src.nl_probem_generators.job_shop_scheduling_make_nl import generate_jobshop_prompt
 from csp_cop_src.problems.base_problem import BaseProblem
-from csp_cop_src.problem_generators.job_shop_scheduling_generator import JobShopProblemCOPGenerator, JobShopProblemCSPGenerator
 from csp_cop_src.problem_generators.base_problem_generator import ProblemGenerator
-from csp_cop_src.solvers.solve_job_shop_scheduling import solve_job_shop_scheduling
 
-PROBLEM_GENERATOR_CLASSES: Dict[str, type[ProblemGenerator]] = {
-    "JobShopProblemCOPGenerator": JobShopProblemCOPGenerator,
-    "JobShopProblemCSPGenerator": JobShopProblemCSPGenerator,
-}
+PROCESS_CHUNKSIZE = 8 # Problems handed to a worker at once, amortizes pickling
+PARQUET_COMPRESSION = "zstd" # Repeated JSON keys in the solution column compress well
+
+def _load_problem_generator_classes() -> Dict[str, type[ProblemGenerator]]:
+    """
+    Imports the concrete generators (and OR-Tools with them) only once arguments are parsed.
+    """
+    from csp_cop_src.problem_generators.job_shop_scheduling_generator import JobShopProblemCOPGenerator, JobShopProblemCSPGenerator
+    return {
+        "JobShopProblemCOPGenerator": JobShopProblemCOPGenerator,
+        "JobShopProblemCSPGenerator": JobShopProblemCSPGenerator,
+    }
+
+_SOLVER = None # CpSolver reused by every problem a worker process solves
+
+def _init_worker(num_search_workers: int) -> None:
+    """
+    Pool initializer: builds the worker's CpSolver once instead of once per problem.
+    Each worker gets its share of the cores for CP-SAT's parallel search.
+    """
+    global _SOLVER
+    from csp_cop_src.solvers.cp_sat import make_solver
+    _SOLVER = make_solver(num_search_workers)
+
+def _process_problem(problem: BaseProblem) -> str:
+    """
+    Solves and validates a single problem in a worker process.
+    Returns the serialized example solution; raises RuntimeError if it fails validation.
+    """
+    from csp_cop_src.solvers.solve_job_shop_scheduling import solve_job_shop_scheduling
+    from csp_cop_src.validators.job_shop_scheduling_validator import validate_job_shop_solution
+
+    solution = solve_job_shop_scheduling(problem, solver=_SOLVER)
+    is_valid, _, _ = validate_job_shop_solution(problem, solution, collect_messages=False, fast_fail=True)
+    if not is_valid:
+        # Rare: validate again, in full, only to report what is wrong
+        _, _, error_details = validate_job_shop_solution(problem, solution)
+        raise RuntimeError(
+            f"Solver returned an invalid solution for problem {problem.problem_id}: {error_details}"
+        )
+    return solution.to_jsons()
 
 def main():
     parser = argparse.ArgumentParser(description="Generate and split problems based on a YAML config.")
@@ -26,8 +60,15 @@ def main():
                         help="Path to the YAML configuration file.")
     parser.add_argument("--output_dir", type=str, required=True, help="Directory to save the generated dataset splits.")
     parser.add_argument("--dataset_name", type=str, required=True, help="Base name for the dataset files.")
+    parser.add_argument("--num_workers", type=int, default=os.cpu_count(),
+                        help="Number of worker processes used to solve and validate problems.")
     args = parser.parse_args()
 
+    import yaml
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PROBLEM_GENERATOR_CLASSES = _load_problem_generator_classes()
+
     output_dir = args.output_dir
     dataset_name = args.dataset_name
     os.makedirs(output_dir, exist_ok=True)
@@ -91,25 +132,25 @@ def main():
     print("\nAll problem generators successfully instantiated.")
 
     all_problems: List[BaseProblem] = []
+    # Split the cores between worker processes so parallel CP-SAT search does not oversubscribe them
+    num_search_workers = max(1, (os.cpu_count() or 1) // args.num_workers)
     # 3. Generate problems using the instantiated generators
     for generator_instance, num_samples, prefix in instantiated_generators:
         print(f"Generating {num_samples} problems for '{prefix}' using {type(generator_instance).__name__}...")
         problems_for_type = generator_instance.generate_problems(num_samples, prefix=prefix)
-        problem_nl_query_soln = []
-        from csp_cop_src.validators.job_shop_scheduling_validator import validate_job_shop_solution
-        for problem in problems_for_type:
-            solution = solve_job_shop_scheduling(problem)
-            is_valid, _, _ = validate_job_shop_solution(problem, solution)
-            if not is_valid:
-                breakpoint
-            print(f"Problem {problem.problem_id} is valid")
-
-            problem_dict = {
-                'problem': problem.to_jsons(),
-                'prompt': generate_jobshop_prompt(problem.to_dict()),
-                'example_solution': solution.to_jsons()
-            }
-            problem_nl_query_soln.append(problem_dict)
+        with ProcessPoolExecutor(max_workers=args.num_workers, initializer=_init_worker,
+                                 initargs=(num_search_workers,)) as pool:
+            solutions_jsons = pool.map(_process_problem, problems_for_type, chunksize=PROCESS_CHUNKSIZE)
+            # Prompts are built here so template sampling uses this process's RNG,
+            # not a copy forked into every worker.
+            problem_nl_query_soln = [
+                {
+                    'problem': problem.to_jsons(),
+                    'prompt': generate_jobshop_prompt(problem.to_dict()),
+                    'example_solution': solution_jsons
+                }
+                for problem, solution_jsons in zip(problems_for_type, solutions_jsons)
+            ]
         all_problems.extend(problem_nl_query_soln)
         print(f"Generated {len(problems_for_type)} problems for '{prefix}'.")
     print(f"\nTotal problems generated: {len(all_problems)}")
@@ -133,11 +174,14 @@ def main():
     print(f"  Validation problems: {len(val_problems)}")
     print(f"  Test problems: {len(test_problems)}")
 
-    # Save splits to CSV files
-    pd.DataFrame(train_problems).to_csv(os.path.join(output_dir, f"{dataset_name}_train.csv"), index=False)
-    pd.DataFrame(val_problems).to_csv(os.path.join(output_dir, f"{dataset_name}_val.csv"), index=False)
-    pd.DataFrame(test_problems).to_csv(os.path.join(output_dir, f"{dataset_name}_test.csv"), index=False)
-    print(f"Saved train/val/test splits to {output_dir} with base name '{dataset_name}_<split>.csv'.")
+    # Save splits to Parquet files
+    for split, rows in [("train", train_problems), ("val", val_problems), ("test", test_problems)]:
+        pq.write_table(
+            pa.Table.from_pylist(rows),
+            os.path.join(output_dir, f"{dataset_name}_{split}.parquet"),
+            compression=PARQUET_COMPRESSION,
+        )
+    print(f"Saved train/val/test splits to {output_dir} with base name '{dataset_name}_<split>.parquet'.")
 
     # You can now use train_problems, val_problems, test_problems for your downstream tasks.
     # For example, saving them to files or passing them to a model.
@@ -1,4 +1,5 @@
 import random
+from string import Formatter
 
 # ─── 2.1. Define the template lists ─────────────────────────────────────────────
 
@@ -114,6 +115,25 @@ Job <i>: (machine_<m₁>, <start₁>, <end₁>), (machine_<m₂>, <start₂>, <e
 Makespan: <M>"""
 ]
 
+def _compile_template(template):
+    """
+    Parse a template's {field} placeholders once and return a renderer that fills
+    them by plain concatenation, so str.format does not re-parse it on every prompt.
+    """
+    pieces = [(literal, field) for literal, field, _, _ in Formatter().parse(template)]
+
+    def render(**fields):
+        return "".join(
+            literal if field is None else literal + str(fields[field])
+            for literal, field in pieces
+        )
+    return render
+
+CSP_RENDERERS = [_compile_template(t) for t in CSP_TEMPLATES]
+COP_RENDERERS = [_compile_template(t) for t in COP_TEMPLATES]
+N_CSP_RENDERERS = len(CSP_RENDERERS)
+N_COP_RENDERERS = len(COP_RENDERERS)
+
 # ─── 2.2. Helper: format the jobs list as a readable string ────────────────────────
 
 def _format_jobs_description(jobs):
@@ -121,15 +141,11 @@ def _format_jobs_description(jobs):
     Convert jobs = [[(machine_id, duration), …], …] into a single string like:
       Job 0: Machine 0 for 2, then Machine 1 for 3; Job 1: Machine 1 for 2, then Machine 0 for 3
     """
-    lines = []
-    for job_idx, task_list in enumerate(jobs):
-        # Build a “Machine X for D” sequence for this job
-        pieces = [f"Machine {m} for {d}" for (m, d) in task_list]
-        # Join with “then”
-        line = f"Job {job_idx}: " + " then ".join(pieces)
-        lines.append(line)
-    # Join all jobs with “; ”
-    return "; ".join(lines)
+    # One generator feeding a single "; " join; each job's pieces joined with " then "
+    return "; ".join(
+        f"Job {job_idx}: " + " then ".join(f"Machine {m} for {d}" for (m, d) in task_list)
+        for job_idx, task_list in enumerate(jobs)
+    )
 
 # ─── 2.3. Main function: pick a template and fill it in ────────────────────────────
 
@@ -154,12 +170,12 @@ def generate_jobshop_prompt(problem_dict):
     # 2) Choose CSP vs. COP
     if makespan_target is not None:
         # CSP‐style
-        template = random.choice(CSP_TEMPLATES)
-        return template.format(
+        render = CSP_RENDERERS[random.randrange(N_CSP_RENDERERS)]
+        return render(
             jobs_description=jobs_desc,
             makespan_target=makespan_target
         )
     else:
         # COP‐style
-        template = random.choice(COP_TEMPLATES)
-        return template.format(jobs_description=jobs_desc)
\ No newline at end of file
+        render = COP_RENDERERS[random.randrange(N_COP_RENDERERS)]
+        return render(jobs_description=jobs_desc)
\ No newline at end of file
@@ -5,8 +5,17 @@ from typing import Generic, TypeVar, Optional, List
 from csp_cop_src.problems.base_problem import BaseProblem
 import uuid
 
+# Optional: a Bloom filter keeps duplicate tracking to a few MB on very large runs.
+# False positives only cost an extra retry. Fall back to a plain set when missing.
+try:
+    from pybloom_live import BloomFilter
+except ImportError:
+    BloomFilter = None
+
 ProblemType = TypeVar("ProblemType", bound=BaseProblem) # Constraint ProblemType to be a subclass of BaseProblem
 MAX_DUPLICATE_RETRIES = 5 # Maximum number of retries if a duplicate problem is generated
+BLOOM_FILTER_MIN_SAMPLES = 50_000 # Above this many samples, track fingerprints in a Bloom filter
+BLOOM_FILTER_ERROR_RATE = 0.001 # False-positive rate of the Bloom filter
 
 class ProblemGenerator(ABC, Generic[ProblemType]):
     def __init__(self) -> None:
@@ -18,7 +27,7 @@ class ProblemGenerator(ABC, Generic[ProblemType]):
 
     def generate_problems(self, num_samples: int, prefix: Optional[str] = None) -> List[ProblemType]:
         """
-        Generates a list of problem instances, checking for duplicates based on hash.
+        Generates a list of problem instances, checking for duplicates based on their fingerprint.
         Retries generation if a duplicate is found, up to MAX_DUPLICATE_RETRIES.
         If duplicates persist, a warning is issued, and the duplicate is included.
 
@@ -26,7 +35,10 @@ class ProblemGenerator(ABC, Generic[ProblemType]):
             A list containing num_samples problem instances.
         """
         problems: List[ProblemType] = []
-        seen_hashes = set()
+        if BloomFilter is not None and num_samples > BLOOM_FILTER_MIN_SAMPLES:
+            seen_fingerprints = BloomFilter(capacity=num_samples * 2, error_rate=BLOOM_FILTER_ERROR_RATE)
+        else:
+            seen_fingerprints = set()
 
         for i in range(num_samples):
             # Determine the problem_id for the current sample *before* retries
@@ -38,10 +50,11 @@ class ProblemGenerator(ABC, Generic[ProblemType]):
             generated_problem: Optional[ProblemType] = None
             for attempt in range(MAX_DUPLICATE_RETRIES + 1):
                 candidate_problem = self.generate_problem(problem_id=current_problem_id_for_sample)
-                problem_hash = hash(candidate_problem)
+                # Tuple of ints hashed in C; no JSON round-trip and no hash collisions
+                fingerprint = candidate_problem._fingerprint()
 
-                if problem_hash not in seen_hashes:
-                    seen_hashes.add(problem_hash)
+                if fingerprint not in seen_fingerprints:
+                    seen_fingerprints.add(fingerprint)
                     generated_problem = candidate_problem
                     break  # Unique problem found
                 else:
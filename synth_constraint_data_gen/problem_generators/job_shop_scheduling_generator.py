@@ -2,14 +2,19 @@ from __future__ import annotations
 
 import logging
 import math
+import multiprocessing
+import os
 import random
 import uuid
+from bisect import bisect_right
 from functools import lru_cache
+from itertools import accumulate
 from typing import Dict, List, Tuple, Optional
 
 from csp_cop_src.problems.job_shop_scheduling import JobShopSchedulingProblem, Job, Task
 from csp_cop_src.problem_generators.base_problem_generator import ProblemGenerator
-from csp_cop_src.solvers.solve_job_shop_scheduling import solve_job_shop_scheduling
+from csp_cop_src.solvers.solve_job_shop_scheduling import greedy_makespan, solve_job_shop_scheduling
+from csp_cop_src.solvers.cp_sat import make_solver, set_default_solver
 
 logger = logging.getLogger(__name__)
 MAKESPAN_TARGET_FACTOR: int = 2
@@ -26,19 +31,27 @@ def _sample_job_lengths(*, n: int, k: int, l: int, total: int, rng: random.Rando
     C = l - k
     residual = total - n * k
 
-    @lru_cache(maxsize=None)
-    def N(r: int, m: int) -> int:
-        if r == 0:
-            return 1
-        if m == 0:
-            return 0
-        return sum(N(r - t, m - 1) for t in range(0, min(C, r) + 1))
+    # N[m][r]: number of ways m jobs can share r extra tasks, each taking 0..C.
+    # Built bottom-up; each row is a sliding-window sum over the previous one.
+    N: List[List[int]] = [[1] + [0] * residual]
+    for _ in range(n - 1):
+        prev = N[-1]
+        row: List[int] = []
+        cum = 0
+        for r in range(residual + 1):
+            cum += prev[r]
+            if r > C:
+                cum -= prev[r - C - 1]
+            row.append(cum)
+        N.append(row)
 
     lengths: List[int] = []
     for i in range(n - 1):
         upper = min(C, residual)
-        weights = [N(residual - t, n - i - 1) for t in range(upper + 1)]
-        t = rng.choices(range(upper + 1), weights)[0]
+        # Cumulative N(residual - t, n - i - 1) for t = 0..upper, sampled by inverse
+        # CDF; draws exactly what rng.choices(range(upper + 1), weights) would
+        cum_weights = list(accumulate(N[n - i - 1][residual - upper:residual + 1][::-1]))
+        t = bisect_right(cum_weights, rng.random() * cum_weights[-1], 0, upper)
         lengths.append(k + t)
         residual -= t
     lengths.append(k + residual)
@@ -48,6 +61,88 @@ def _sample_job_lengths(*, n: int, k: int, l: int, total: int, rng: random.Rando
 # 2) Exact machine‑sequence sampler with ≥1 coverage
 # ---------------------------------------------------------------------------
 
+REMAINING_JOBS_CACHE_SIZE = 1 << 16 # Bounds the cross-instance completion-count cache
+
+# ----- enumerate sequences of a given length, keyed by coverage mask -----
+@lru_cache(maxsize=None)
+def _enumerate_len(L: int, m: int) -> Tuple[int, ...]:
+    """Count machine sequences of length L (no machine twice in a row) per coverage mask."""
+    masks = 1 << m
+    dp_prev = [[0] * m for _ in range(masks)]
+    for machine in range(m):
+        dp_prev[1 << machine][machine] = 1
+    for _ in range(1, L):
+        dp_next = [[0] * m for _ in range(masks)]
+        for mask in range(masks):
+            row = dp_prev[mask]
+            row_total = sum(row)
+            if row_total == 0:
+                continue
+            # Every sequence ending in mask can step to any machine except its last one
+            for machine in range(m):
+                cnt = row_total - row[machine]
+                if cnt:
+                    dp_next[mask | (1 << machine)][machine] += cnt
+        dp_prev = dp_next
+    return tuple(sum(dp_prev[mask]) for mask in range(masks))
+
+@lru_cache(maxsize=None)
+def _nonzero_len_counts(L: int, m: int) -> Tuple[Tuple[int, int], ...]:
+    """(mask, count) pairs of _enumerate_len(L, m) with count > 0."""
+    return tuple((mask, cnt) for mask, cnt in enumerate(_enumerate_len(L, m)) if cnt)
+
+@lru_cache(maxsize=None)
+def _num_free_seqs(L: int, m: int) -> int:
+    """Number of machine sequences of length L (no machine twice in a row), whatever they cover."""
+    return sum(_enumerate_len(L, m))
+
+# ----- global DP: how many completions for the remaining jobs and missing_mask -----
+@lru_cache(maxsize=REMAINING_JOBS_CACHE_SIZE)
+def _count_remaining_jobs(remaining_lengths: Tuple[int, ...], missing: int, m: int) -> int:
+    # Keyed on the remaining lengths rather than (all lengths, idx) so that any
+    # two instances ending in the same lengths share entries
+    if missing == 0:
+        # Remaining jobs unconstrained (all machines already seen): any sequence of
+        # each length completes the assignment. The exact count, not 1, keeps the
+        # weights uniform over whole assignments and so independent of job order
+        return math.prod(_num_free_seqs(L, m) for L in remaining_lengths)
+    if not remaining_lengths:
+        return 0  # no jobs left but still missing machines
+    rest_lengths = remaining_lengths[1:]
+    total = 0
+    for mask, cnt in _nonzero_len_counts(remaining_lengths[0], m):
+        new_missing = missing & ~mask  # clear any machines this job covers
+        rest = _count_remaining_jobs(rest_lengths, new_missing, m)
+        total += cnt * rest
+    return total
+
+# ----- completions of a partial sequence that still has to cover a mask -----
+@lru_cache(maxsize=None)
+def _seq_ways_table(L: int, m: int) -> List[List[Tuple[int, ...]]]:
+    """
+    ways[pos][last][mask]: number of ways to fill positions pos..L-1 after placing
+    machine `last` at pos-1, such that every machine in `mask` appears. Filled
+    bottom-up once per (L, m); row 0 is unused.
+    """
+    masks = 1 << m
+    bits = [1 << machine for machine in range(m)]
+    done = tuple(int(mask == 0) for mask in range(masks))
+    ways: List[List[Tuple[int, ...]]] = [[] for _ in range(L + 1)]
+    ways[L] = [done] * m
+    for pos in range(L - 1, 0, -1):
+        nxt = ways[pos + 1]
+        # Completions from pos with no restriction on the machine placed at pos
+        step = [
+            [nxt[machine][mask & ~bits[machine]] for mask in range(masks)]
+            for machine in range(m)
+        ]
+        any_machine = [sum(col) for col in zip(*step)]
+        ways[pos] = [
+            tuple(a - b for a, b in zip(any_machine, step[last]))
+            for last in range(m)
+        ]
+    return ways
+
 class _ExactMachineSampler:
     """Generates per‑job machine ID sequences uniformly under constraints."""
 
@@ -57,56 +152,28 @@ class _ExactMachineSampler:
         self.job_lengths = job_lengths
         self.m = num_machines
         self.rng = rng
-        self._per_len_counts = {L: self._enumerate_len(L) for L in set(job_lengths)}
-        self._count_remaining_jobs = lru_cache(maxsize=None)(self._count_remaining_jobs)  # type: ignore
-
-    # ----- enumerate sequences of a given length, keyed by coverage mask -----
-    def _enumerate_len(self, L: int) -> List[int]:
-        m = self.m
-        masks = 1 << m
-        dp_prev = [[0] * m for _ in range(masks)]
-        for machine in range(m):
-            dp_prev[1 << machine][machine] = 1
-        for _ in range(1, L):
-            dp_next = [[0] * m for _ in range(masks)]
-            for mask in range(masks):
-                for last, cnt in enumerate(dp_prev[mask]):
-                    if cnt == 0:
-                        continue
-                    for machine in range(m):
-                        if machine == last:
-                            continue
-                        dp_next[mask | (1 << machine)][machine] += cnt
-            dp_prev = dp_next
-        return [sum(dp_prev[mask]) for mask in range(masks)]
-
-    # ----- global DP: how many completions from state (idx, missing_mask) -----
+        # The DP runs over jobs sorted by length, so instances whose lengths overlap
+        # share suffixes in the module-level remaining-jobs cache. Completion counts
+        # are exact, so the law over whole assignments does not depend on the order
+        # jobs are processed in; sample() maps results back to the input order.
+        self._order = sorted(range(len(job_lengths)), key=lambda i: job_lengths[i])
+        self._sorted_lengths = tuple(job_lengths[i] for i in self._order)
+        self._nonzero_entries = {L: _nonzero_len_counts(L, num_machines) for L in set(job_lengths)}
+
     def _count_remaining_jobs(self, idx: int, missing: int) -> int:
-        if missing == 0:
-            # Remaining jobs unconstrained (all machines already seen)
-            return 1
-        if idx == len(self.job_lengths):
-            return 0  # no jobs left but still missing machines
-        seq_counts = self._per_len_counts[self.job_lengths[idx]]
-        total = 0
-        for mask, cnt in enumerate(seq_counts):
-            if cnt == 0:
-                continue
-            new_missing = missing & ~mask  # clear any machines this job covers
-            rest = self._count_remaining_jobs(idx + 1, new_missing)
-            total += cnt * rest
-        return total
+        return _count_remaining_jobs(self._sorted_lengths[idx:], missing, self.m)
 
     # ----- public sampler -----
     def sample(self) -> List[List[int]]:
         missing = (1 << self.m) - 1
         sequences: List[List[int]] = []
-        for idx, L in enumerate(self.job_lengths):
-            seq_counts = self._per_len_counts[L]
+        for idx, L in enumerate(self._sorted_lengths):
+            if missing == 0 and self._nonzero_entries[L]:
+                # Coverage is done: every remaining sequence is equally likely
+                sequences.append(self._sample_free_seq(L))
+                continue
             options: List[Tuple[int, int]] = []
-            for mask, cnt in enumerate(seq_counts):
-                if cnt == 0:
-                    continue
+            for mask, cnt in self._nonzero_entries[L]:
                 rest = self._count_remaining_jobs(idx + 1, missing & ~mask)
                 if rest:
                     options.append((mask, cnt * rest))
@@ -117,33 +184,46 @@ class _ExactMachineSampler:
             sequences.append(self._sample_seq(L, chosen_mask))
             missing &= ~chosen_mask
         assert missing == 0
-        return sequences
+        result: List[List[int]] = [None] * len(sequences)
+        for pos, orig in enumerate(self._order):
+            result[orig] = sequences[pos]
+        return result
+
+    # ----- sample sequence with no coverage requirement -----
+    def _sample_free_seq(self, L: int) -> List[int]:
+        """
+        Uniform over sequences with no machine twice in a row. Same distribution as drawing
+        a mask by its sequence count and then _sample_seq (uniform within the mask), with
+        fewer RNG draws.
+        """
+        seq = [self.rng.randrange(self.m)]
+        for _ in range(L - 1):
+            nxt = self.rng.randrange(self.m - 1)
+            seq.append(nxt + (nxt >= seq[-1])) # skip over the previous machine
+        return seq
 
     # ----- sample concrete sequence with given coverage mask -----
     def _sample_seq(self, L: int, cover_mask: int) -> List[int]:
-        m = self.m
-        @lru_cache(maxsize=None)
-        def ways(pos: int, last: int | None, mask: int) -> int:
-            if pos == L:
-                return int(mask == 0)
-            total = 0
-            for machine in range(m):
-                if machine == last:
-                    continue
-                total += ways(pos + 1, machine, mask & ~(1 << machine))
-            return total
-        seq, last, rem = [], None, cover_mask
+        """
+        Uniform over sequences with no machine twice in a row whose set of machines is
+        exactly `cover_mask`, matching how _enumerate_len counts them. Drawn over local
+        labels 0..k-1 that must all appear, then mapped to the mask's machines.
+        """
+        machines = [machine for machine in range(self.m) if cover_mask >> machine & 1]
+        k = len(machines)
+        ways = _seq_ways_table(L, k)
+        seq, last, rem = [], None, (1 << k) - 1
         for pos in range(L):
             cand, wts = [], []
-            for machine in range(m):
-                if machine == last:
+            for label in range(k):
+                if label == last:
                     continue
-                w = ways(pos + 1, machine, rem & ~(1 << machine))
+                w = ways[pos + 1][label][rem & ~(1 << label)]
                 if w:
-                    cand.append(machine)
+                    cand.append(label)
                     wts.append(w)
             chosen = self.rng.choices(cand, wts)[0]
-            seq.append(chosen)
+            seq.append(machines[chosen])
             rem &= ~(1 << chosen)
             last = chosen
         assert rem == 0
@@ -164,6 +244,11 @@ def generate_random_jssp_cop(
     problem_id: str | None = None,
     rng: random.Random | None = None,
 ) -> JobShopSchedulingProblem:
+    """
+    Sample a random JSSP instance without a makespan target. Callers generating
+    many instances should pass one shared `rng` rather than paying for a freshly
+    seeded Mersenne Twister per call.
+    """
     rng = rng or random.Random()
     lower = max(num_jobs * min_tasks_per_job, num_machines)
     upper = num_jobs * max_tasks_per_job
@@ -175,9 +260,13 @@ def generate_random_jssp_cop(
     seq_sampler = _ExactMachineSampler(job_lengths=job_lengths, num_machines=num_machines, rng=rng)
     machine_seqs = seq_sampler.sample()
 
+    # All durations in one draw, then sliced per job
+    durations = rng.choices(range(min_task_time, max_task_time + 1), k=sum(map(len, machine_seqs)))
     jobs: List[Job] = []
+    offset = 0
     for jid, machines in enumerate(machine_seqs):
-        tasks = [Task(machine_id=m, duration=rng.randint(min_task_time, max_task_time)) for m in machines]
+        tasks = [Task(machine_id=m, duration=d) for m, d in zip(machines, durations[offset:offset + len(machines)])]
+        offset += len(machines)
         jobs.append(Job(job_id=jid, tasks=tasks))
 
     return JobShopSchedulingProblem(problem_id=problem_id or str(uuid.uuid4()), jobs=jobs)
@@ -195,9 +284,20 @@ def generate_random_jssp_csp(
     min_task_time: int,
     max_task_time: int,
     satisfiable_makespan: bool = True,
+    use_solver_upper_bound: bool = False,
     problem_id: str | None = None,
     rng: random.Random | None = None,
 ) -> JobShopSchedulingProblem:
+    """
+    Sample a COP instance and attach a makespan target. The same `rng` drives both
+    steps; pass a shared one when generating many.
+
+    Unsatisfiable targets need the optimum, so that path always runs CP-SAT.
+    Satisfiable targets only need a feasible makespan: by default they are drawn
+    above a greedy schedule's makespan without solving. Set use_solver_upper_bound
+    to draw them from [opt, opt * MAKESPAN_TARGET_FACTOR] instead.
+    """
+    rng = rng or random.Random()
     cop = generate_random_jssp_cop(
         num_jobs=num_jobs,
         num_machines=num_machines,
@@ -208,16 +308,20 @@ def generate_random_jssp_csp(
         problem_id=problem_id,
         rng=rng,
     )
+    if satisfiable_makespan and not use_solver_upper_bound:
+        upper = greedy_makespan(cop.jobs)
+        target = rng.randint(upper, upper * MAKESPAN_TARGET_FACTOR)
+        return JobShopSchedulingProblem(problem_id=cop.problem_id, jobs=cop.jobs, makespan_target=target)
+
     sol = solve_job_shop_scheduling(cop)
     if sol is None:
         raise RuntimeError("Solver failed; cannot build CSP instance")
     opt = sol.makespan
-    rng = rng or random.Random()
     if satisfiable_makespan:
         target = rng.randint(opt, opt * MAKESPAN_TARGET_FACTOR)
     else:
         target = rng.randint(max(1, opt // MAKESPAN_TARGET_FACTOR), opt - 1)
-    return JobShopSchedulingProblem(problem_id=problem_id or str(uuid.uuid4()), jobs=cop.jobs, makespan_target=target)
+    return JobShopSchedulingProblem(problem_id=cop.problem_id, jobs=cop.jobs, makespan_target=target)
 
 
 # ---------------------------------------------------------------------------
@@ -282,6 +386,51 @@ def _sample_j_m_t(
     t_min_eff = max(t_min, math.ceil(num_machines / num_jobs))
     return num_jobs, num_machines, t_min_eff, t_max
     
+# ----- parallel batch generation -----
+_BATCH_GENERATOR: Optional[ProblemGenerator] = None # Per-worker copy, set by _init_batch_worker
+
+def _init_batch_worker(generator: ProblemGenerator, num_search_workers: int) -> None:
+    """
+    Pool initializer: stores the worker's generator and gives the process its own
+    CpSolver with its share of the cores, instead of default_solver() running one
+    search thread per core in every process.
+    """
+    global _BATCH_GENERATOR
+    _BATCH_GENERATOR = generator
+    set_default_solver(make_solver(num_search_workers))
+
+def _generate_seeded(args: Tuple[int, str, int]) -> Tuple[int, JobShopSchedulingProblem]:
+    index, problem_id, seed = args
+    _BATCH_GENERATOR.rng = random.Random(seed)
+    return index, _BATCH_GENERATOR.generate_problem(problem_id=problem_id)
+
+def _generate_problems_batch(
+    generator: ProblemGenerator,
+    n: int,
+    processes: Optional[int],
+    prefix: Optional[str],
+) -> List[JobShopSchedulingProblem]:
+    """
+    Generates n problems across a process pool. Each problem gets a child seed
+    drawn from the generator's rng, so results are deterministic for a given seed
+    and independent of worker scheduling. Unlike generate_problems, duplicates
+    are not filtered.
+    """
+    processes = processes or os.cpu_count() or 1
+    args = [
+        (i, f"{prefix}_{i}" if prefix is not None else str(uuid.uuid4()), generator.rng.randrange(2**63))
+        for i in range(n)
+    ]
+    problems: List[Optional[JobShopSchedulingProblem]] = [None] * n
+    chunksize = max(1, n // (4 * processes))
+    num_search_workers = max(1, (os.cpu_count() or 1) // processes)
+    with multiprocessing.Pool(processes, initializer=_init_batch_worker,
+                              initargs=(generator, num_search_workers)) as pool:
+        # Unordered so one slow instance does not hold back the rest; order restored by index
+        for index, problem in pool.imap_unordered(_generate_seeded, args, chunksize=chunksize):
+            problems[index] = problem
+    return problems
+
 class JobShopProblemCOPGenerator(ProblemGenerator[JobShopSchedulingProblem]):
     def __init__(
         self,
@@ -331,6 +480,12 @@ class JobShopProblemCOPGenerator(ProblemGenerator[JobShopSchedulingProblem]):
             rng=self.rng,
         )
 
+    def generate_problems_batch(
+        self, n: int, processes: Optional[int] = None, prefix: Optional[str] = None
+    ) -> List[JobShopSchedulingProblem]:
+        """Generates n problems in parallel; see _generate_problems_batch."""
+        return _generate_problems_batch(self, n, processes, prefix)
+
 class JobShopProblemCSPGenerator(ProblemGenerator[JobShopSchedulingProblem]):
     def __init__(
         self,
@@ -343,6 +498,7 @@ class JobShopProblemCSPGenerator(ProblemGenerator[JobShopSchedulingProblem]):
         min_task_time: int,
         max_task_time: int,
         satisfiable_makespan: bool = True,
+        use_solver_upper_bound: bool = False,
         seed: int = 42,
     ):
         _validate_ranges(
@@ -360,6 +516,7 @@ class JobShopProblemCSPGenerator(ProblemGenerator[JobShopSchedulingProblem]):
         self.min_task_time = min_task_time
         self.max_task_time = max_task_time
         self.satisfiable_makespan = satisfiable_makespan
+        self.use_solver_upper_bound = use_solver_upper_bound
         self.rng = random.Random(seed)
 
 
@@ -378,7 +535,13 @@ class JobShopProblemCSPGenerator(ProblemGenerator[JobShopSchedulingProblem]):
             min_task_time=self.min_task_time,
             max_task_time=self.max_task_time,
             satisfiable_makespan=self.satisfiable_makespan,
+            use_solver_upper_bound=self.use_solver_upper_bound,
             problem_id=problem_id,
             rng=self.rng,
         )
 
+    def generate_problems_batch(
+        self, n: int, processes: Optional[int] = None, prefix: Optional[str] = None
+    ) -> List[JobShopSchedulingProblem]:
+        """Generates n problems in parallel, each CP-SAT solve in its own worker; see _generate_problems_batch."""
+        return _generate_problems_batch(self, n, processes, prefix)
@@ -1,15 +1,45 @@
 import json
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+# orjson encodes straight to bytes in C; fall back to the stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class BaseProblem(ABC):
     """
     Abstract base class for all problem types.
     Defines common interface for problem instances.
     """
-    def __init__(self, problem_id: str, parameters: Dict[str, Any]):
+    # Thousands of instances are held at once during generation; no per-instance __dict__
+    __slots__ = ('problem_id', '_parameters', '_fingerprint_cache', '_hash_cache')
+
+    def __init__(self, problem_id: str, parameters: Optional[Dict[str, Any]]):
+        """
+        Pass parameters=None to have them derived lazily by _derive_parameters
+        on first access instead of eagerly in the subclass constructor.
+        """
         self.problem_id = problem_id
-        self.parameters = parameters
+        self._parameters = parameters
+        # Problem-defining data is immutable after construction, so both are computed once
+        self._fingerprint_cache: Optional[Tuple] = None
+        self._hash_cache: Optional[int] = None
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        if self._parameters is None:
+            self._parameters = self._derive_parameters()
+        return self._parameters
+
+    @parameters.setter
+    def parameters(self, value: Dict[str, Any]):
+        self._parameters = value
+
+    def _derive_parameters(self) -> Dict[str, Any]:
+        """Derived parameters for prompting/logging. Subclasses override."""
+        return {}
 
     @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
@@ -22,9 +52,17 @@ class BaseProblem(ABC):
         """Creates a problem instance from a dictionary."""
         pass
 
-    def to_jsons(self) -> str:
-        """Serializes the problem instance to a JSON string."""
-        return json.dumps(self.to_dict(), indent=4)
+    def _to_json_bytes(self) -> bytes:
+        """Compact JSON encoding of to_dict(), for machine-consumed output."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode()
+
+    def to_jsons(self, pretty: bool = False) -> str:
+        """Serializes the problem instance to a JSON string. Set pretty for indented output."""
+        if pretty:
+            return json.dumps(self.to_dict(), indent=4)
+        return self._to_json_bytes().decode()
 
     @classmethod
     def from_jsons(cls, json_str: str):
@@ -32,10 +70,14 @@ class BaseProblem(ABC):
         data = json.loads(json_str)
         return cls.from_dict(data)
 
-    def to_json(self, filepath: str):
+    def to_json(self, filepath: str, pretty: bool = False):
         """Saves the problem instance to a JSON file."""
-        with open(filepath, 'w') as f:
-            f.write(self.to_jsons())
+        if pretty:
+            with open(filepath, 'w') as f:
+                f.write(self.to_jsons(pretty=True))
+            return
+        with open(filepath, 'wb') as f:
+            f.write(self._to_json_bytes())
 
     @classmethod
     def from_json(cls, filepath: str):
@@ -55,8 +97,15 @@ class BaseProblem(ABC):
         """Return a canonical, hashable representation of the problem-defining data. Subclasses must implement."""
         pass
 
+    def _fingerprint(self):
+        """Return a hashable canonical key of the problem-defining data, cached after the first call."""
+        if self._fingerprint_cache is None:
+            self._fingerprint_cache = tuple(sorted(self._normalized_data().items()))
+        return self._fingerprint_cache
+
     def __hash__(self):
-        # Hash the normalized, canonical data
-        norm = self._normalized_data()
-        norm_json = json.dumps(norm, sort_keys=True)
-        return hash(norm_json)
\ No newline at end of file
+        # Hash the normalized, canonical data; every subclass returns hashable
+        # tuples, so the fingerprint is hashed directly instead of via JSON
+        if self._hash_cache is None:
+            self._hash_cache = hash(self._fingerprint())
+        return self._hash_cache
\ No newline at end of file
@@ -5,8 +5,10 @@ class BinPackingProblem(BaseProblem):
     """
     Represents an instance of a Bin Packing Problem.
     """
+    __slots__ = ('bin_capacity', 'item_sizes', 'num_bins_target', 'num_items', 'total_item_size')
+
     def __init__(self, problem_id: str, bin_capacity: int, item_sizes: List[int], num_bins_target: int = None):
-        super().__init__(problem_id, {})
+        super().__init__(problem_id, None) # parameters derived on first access
         if not isinstance(bin_capacity, int) or bin_capacity <= 0:
             raise ValueError("bin_capacity must be a positive integer.")
         if not isinstance(item_sizes, list) or not all(isinstance(s, int) and s > 0 for s in item_sizes):
@@ -17,7 +19,6 @@ class BinPackingProblem(BaseProblem):
         self.num_bins_target = num_bins_target
         self.num_items = len(item_sizes)
         self.total_item_size = sum(item_sizes)
-        self.parameters = self._derive_parameters()
 
     def _derive_parameters(self) -> Dict[str, Any]:
         parameters = {
@@ -25,8 +26,7 @@ class BinPackingProblem(BaseProblem):
             "bin_capacity": self.bin_capacity,
             "total_item_size": self.total_item_size,
             "average_item_size": round(self.total_item_size / self.num_items, 2) if self.num_items > 0 else 0,
-            "item_sizes_list": self.item_sizes # Can be useful for NL generation
-        }
+        } # Scalars only: item_sizes is already a top-level field of to_dict()
         if self.num_bins_target is not None:
             parameters["num_bins_target"] = self.num_bins_target
             parameters["problem_type"] = "CSP"
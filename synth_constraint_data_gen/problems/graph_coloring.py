@@ -6,6 +6,8 @@ class GraphColoringProblem(BaseProblem):
     """
     Represents an instance of a Graph Coloring Problem.
     """
+    __slots__ = ('num_nodes', 'edges', 'num_colors_target', 'num_edges')
+
     def __init__(self, problem_id: str, num_nodes: int, edges: List[Tuple[int, int]], num_colors_target: int = None):
         """
         Initializes a Graph Coloring Problem instance.
@@ -18,7 +20,7 @@ class GraphColoringProblem(BaseProblem):
             num_colors_target (int, optional): An optional target for the number of colors (for CSP variants).
                                                If not provided, it's typically a COP problem aiming to minimize colors.
         """
-        super().__init__(problem_id, {})
+        super().__init__(problem_id, None) # parameters derived on first access
         if not isinstance(num_nodes, int) or num_nodes <= 0:
             raise ValueError("num_nodes must be a positive integer.")
         if not isinstance(edges, list) or not all(isinstance(e, tuple) and len(e) == 2 for e in edges):
@@ -27,10 +29,9 @@ class GraphColoringProblem(BaseProblem):
             raise ValueError(f"Edge nodes must be within [0, {num_nodes-1}].")
 
         self.num_nodes = num_nodes
-        self.edges = sorted(list(set([tuple(sorted(edge)) for edge in edges]))) # Store unique, sorted edges
+        self.edges = sorted({(u, v) if u <= v else (v, u) for u, v in edges}) # Store unique, sorted edges
         self.num_colors_target = num_colors_target
         self.num_edges = len(self.edges)
-        self.parameters = self._derive_parameters()
 
     def _derive_parameters(self) -> Dict[str, Any]:
         """Derives a comprehensive set of parameters from the graph data."""
@@ -40,8 +41,7 @@ class GraphColoringProblem(BaseProblem):
             "num_nodes": self.num_nodes,
             "num_edges": self.num_edges,
             "graph_density": round(density, 4),
-            "edges_list": self.edges, # Include for detailed logging/prompting
-        }
+        } # Scalars only: edges is already a top-level field of to_dict()
         if self.num_colors_target is not None:
             parameters["num_colors_target"] = self.num_colors_target
             parameters["problem_type"] = "CSP"
@@ -73,9 +73,8 @@ class GraphColoringProblem(BaseProblem):
         )
 
     def _normalized_data(self):
-        edges_norm = tuple(sorted(tuple(sorted(edge)) for edge in self.edges))
         return {
             'num_nodes': self.num_nodes,
-            'edges': edges_norm,
+            'edges': tuple(self.edges), # Already canonical and sorted in __init__
             'num_colors_target': self.num_colors_target
         }
\ No newline at end of file
@@ -1,4 +1,6 @@
 import json
+from itertools import repeat, starmap
+from operator import itemgetter
 from typing import List, Dict, Any, Tuple
 from csp_cop_src.problems.base_problem import BaseProblem
 
@@ -7,6 +9,8 @@ class Task:
     Represents a single task within a job in Job-Shop Scheduling.
     A task is performed on a specific machine for a given duration.
     """
+    __slots__ = ('machine_id', 'duration')
+
     def __init__(self, machine_id: int, duration: int):
         if not isinstance(machine_id, int) or machine_id < 0:
             raise ValueError("machine_id must be a non-negative integer.")
@@ -19,6 +23,14 @@ class Task:
         """Converts the Task object to a (machine_id, duration) tuple."""
         return (self.machine_id, self.duration)
 
+    @classmethod
+    def _unchecked(cls, machine_id: int, duration: int):
+        """Creates a Task without validation, for callers that already checked the values in bulk."""
+        task = object.__new__(cls)
+        task.machine_id = machine_id
+        task.duration = duration
+        return task
+
     @classmethod
     def from_tuple(cls, data_tuple: Tuple[int, int]):
         """Creates a Task object from a (machine_id, duration) tuple."""
@@ -38,6 +50,8 @@ class Job:
     """
     Represents a single job in Job-Shop Scheduling, consisting of a sequence of tasks.
     """
+    __slots__ = ('job_id', 'tasks')
+
     def __init__(self, job_id: int, tasks: List[Task]):
         if not isinstance(job_id, int) or job_id < 0:
             raise ValueError("job_id must be a non-negative integer.")
@@ -48,17 +62,36 @@ class Job:
         self.job_id = job_id
         self.tasks = tasks
 
+    @classmethod
+    def _unchecked(cls, job_id: int, tasks: List[Task]):
+        """Creates a Job without validation, for callers that built the tasks themselves."""
+        job = object.__new__(cls)
+        job.job_id = job_id
+        job.tasks = tasks
+        return job
+
     def to_list_of_tuples(self) -> List[Tuple[int, int]]:
         """Converts the Job object to a list of (machine_id, duration) tuples."""
-        return [task.to_tuple() for task in self.tasks]
+        # Slot reads inline rather than a to_tuple() call per task
+        return [(task.machine_id, task.duration) for task in self.tasks]
 
     @classmethod
     def from_list_of_tuples(cls, job_id: int, data_list: List[Tuple[int, int]]):
         """Creates a Job object from a list of (machine_id, duration) tuples."""
-        if not (isinstance(data_list, list) and all(isinstance(t, tuple) and len(t) == 2 for t in data_list)):
+        # Shape check and the Task.__init__ value checks run once per column, in C, instead of per task
+        if not (isinstance(data_list, list) and all(map(isinstance, data_list, repeat(tuple)))
+                and all(map((2).__eq__, map(len, data_list)))):
             raise ValueError("Job data must be a list of (machine_id, duration) tuples.")
-        tasks = [Task.from_tuple(t_tuple) for t_tuple in data_list]
-        return cls(job_id=job_id, tasks=tasks)
+        machine_ids, durations = zip(*data_list) if data_list else ((), ())
+        if not all(map(isinstance, machine_ids, repeat(int))) or min(machine_ids, default=0) < 0:
+            raise ValueError("machine_id must be a non-negative integer.")
+        if not all(map(isinstance, durations, repeat(int))) or min(durations, default=1) <= 0:
+            raise ValueError("duration must be a positive integer.")
+        if not isinstance(job_id, int) or job_id < 0:
+            raise ValueError("job_id must be a non-negative integer.")
+        if not data_list:
+            raise ValueError("A job must have at least one task.")
+        return cls._unchecked(job_id, list(starmap(Task._unchecked, data_list)))
 
     def __repr__(self):
         return f"Job(job_id={self.job_id}, tasks={self.tasks})"
@@ -73,6 +106,8 @@ class JobShopSchedulingProblem(BaseProblem):
     Represents an instance of a Job-Shop Scheduling Problem.
     Now uses explicit Task and Job classes for clearer definition.
     """
+    __slots__ = ('jobs', 'num_jobs', 'num_machines', 'makespan_target')
+
     def __init__(self, problem_id: str, jobs: List[Job], makespan_target: int = None):
         """
         Initializes a Job-Shop Scheduling Problem instance.
@@ -90,28 +125,29 @@ class JobShopSchedulingProblem(BaseProblem):
             raise ValueError("The problem must contain at least one job.")
         self.jobs = jobs
         self.num_jobs = len(jobs)
-        self.num_machines = self._get_num_machines()
         self.makespan_target = makespan_target
         self.parameters = self._derive_parameters()
-
-    def _get_num_machines(self) -> int:
-        """Determines the total number of unique machines across all jobs."""
-        machines = set()
-        for job in self.jobs:
-            for task in job.tasks:
-                machines.add(task.machine_id)
-        return len(machines)
+        self.num_machines = self.parameters["num_machines"]
 
     def _derive_parameters(self) -> Dict[str, Any]:
         """Derives a comprehensive set of parameters from the jobs data."""
-        total_tasks = sum(len(job.tasks) for job in self.jobs)
-        total_duration = sum(task.duration for job in self.jobs for task in job.tasks)
-
-        jobs_for_json = [job.to_list_of_tuples() for job in self.jobs]
+        # Single pass over every task: JSON tuples, totals and the set of machines used
+        jobs_for_json = []
+        machines = set()
+        machines_update = machines.update
+        total_tasks = 0
+        total_duration = 0
+        for job in self.jobs:
+            tuples = job.to_list_of_tuples()
+            jobs_for_json.append(tuples)
+            total_tasks += len(tuples)
+            # set.update/sum iterate in C rather than one bytecode step per task
+            machines_update(map(itemgetter(0), tuples))
+            total_duration += sum(map(itemgetter(1), tuples))
 
         parameters = {
             "num_jobs": self.num_jobs,
-            "num_machines": self.num_machines,
+            "num_machines": len(machines),
             "total_tasks": total_tasks,
             "total_duration_sum": total_duration,
             "jobs_description": jobs_for_json, # Store simplified representation in parameters for JSON
@@ -128,11 +164,11 @@ class JobShopSchedulingProblem(BaseProblem):
         Converts the Job-Shop Scheduling problem instance to a dictionary.
         The 'jobs' key will contain the simplified list of lists of tuples representation.
         """
-        jobs_as_tuples = [job.to_list_of_tuples() for job in self.jobs]
         return {
             "problem_id": self.problem_id,
             "problem": "JobShopScheduling",
-            "jobs": jobs_as_tuples, # Storing as list of lists of tuples for JSON
+            # Same list as derived_parameters["jobs_description"], built once in __init__
+            "jobs": self.parameters["jobs_description"], # Storing as list of lists of tuples for JSON
             "makespan_target": self.makespan_target,
             "derived_parameters": self.parameters
         }
@@ -160,11 +196,13 @@ class JobShopSchedulingProblem(BaseProblem):
         )
 
     def _normalized_data(self):
-        # Canonicalize jobs: sort by job_id, and within each job, sort tasks by (machine_id, duration)
-        jobs_norm = tuple(
-            (job.job_id, tuple(sorted((task.machine_id, task.duration) for task in job.tasks)))
-            for job in sorted(self.jobs, key=lambda j: j.job_id)
-        )
+        # Canonicalize jobs: sort by job_id, and within each job, sort tasks by (machine_id, duration).
+        # Reuses the per-job tuples built in __init__ rather than walking job.tasks again
+        jobs_norm = tuple(sorted(
+            ((job.job_id, tuple(sorted(tuples)))
+             for job, tuples in zip(self.jobs, self.parameters["jobs_description"])),
+            key=itemgetter(0)
+        ))
         return {
             'jobs': jobs_norm,
             'makespan_target': self.makespan_target
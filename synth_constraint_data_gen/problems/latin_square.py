@@ -6,6 +6,8 @@ class LatinSquareProblem(BaseProblem):
     Represents an instance of a Latin Square Problem.
     An N x N Latin Square.
     """
+    __slots__ = ('n',)
+
     def __init__(self, problem_id: str, n: int):
         super().__init__(problem_id, {})
         if not isinstance(n, int) or n <= 0:
@@ -7,6 +7,8 @@ class SocialGolfersProblem(BaseProblem):
     Parameters: G golfers, S groups, R rounds. Each group has P players.
     Total golfers G = S * P.
     """
+    __slots__ = ('num_golfers', 'num_groups', 'group_size', 'num_rounds')
+
     def __init__(self, problem_id: str, num_golfers: int, num_groups: int, group_size: int, num_rounds: int):
         super().__init__(problem_id, {})
         if not all(isinstance(arg, int) and arg > 0 for arg in [num_golfers, num_groups, group_size, num_rounds]):
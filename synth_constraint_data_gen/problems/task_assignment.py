@@ -1,3 +1,4 @@
+from array import array
 from typing import List, Dict, Any
 from csp_cop_src.problems.base_problem import BaseProblem
 
@@ -6,6 +7,8 @@ class TaskAssignmentProblem(BaseProblem):
     Represents an instance of a Task Assignment Problem.
     Assigns N agents to M tasks with associated costs/profits.
     """
+    __slots__ = ('num_agents', 'num_tasks', 'costs', 'max_cost_target')
+
     def __init__(self, problem_id: str, num_agents: int, num_tasks: int, costs: List[List[int]], max_cost_target: int = None):
         """
         Args:
@@ -17,32 +20,34 @@ class TaskAssignmentProblem(BaseProblem):
             max_cost_target (int, optional): A target for the maximum total cost (for CSP variants).
                                              If not provided, it's a COP to minimize total cost.
         """
-        super().__init__(problem_id, {})
+        super().__init__(problem_id, None) # parameters derived on first access
         if not all(isinstance(arg, int) and arg > 0 for arg in [num_agents, num_tasks]):
             raise ValueError("num_agents and num_tasks must be positive integers.")
         if not (isinstance(costs, list) and len(costs) == num_agents and
-                all(isinstance(row, list) and len(row) == num_tasks and
-                    all(isinstance(c, int) for c in row) for row in costs)):
+                all(isinstance(row, list) and len(row) == num_tasks for row in costs)):
             raise ValueError("Costs must be a num_agents x num_tasks matrix of integers.")
+        # Rows are stored as packed int64 arrays; the conversion also rejects non-integer entries in C
+        try:
+            cost_rows = [array('q', row) for row in costs]
+        except (TypeError, OverflowError) as e:
+            raise ValueError("Costs must be a num_agents x num_tasks matrix of integers.") from e
 
         self.num_agents = num_agents
         self.num_tasks = num_tasks
-        self.costs = costs
+        self.costs: List[array] = cost_rows # costs[i][j] indexing as before; rows are array('q')
         self.max_cost_target = max_cost_target
-        self.parameters = self._derive_parameters()
 
     def _derive_parameters(self) -> Dict[str, Any]:
-        min_cost_per_task = [min(agent_costs) for agent_costs in zip(*self.costs)] if self.num_tasks > 0 else []
-        max_cost_per_task = [max(agent_costs) for agent_costs in zip(*self.costs)] if self.num_tasks > 0 else []
+        # Transpose once; min/max/sum over the columns all run in C via map
+        cost_per_task = list(zip(*self.costs))
 
         parameters = {
             "num_agents": self.num_agents,
             "num_tasks": self.num_tasks,
             "total_possible_assignments": self.num_agents * self.num_tasks,
-            "min_total_possible_cost": sum(min_cost_per_task) if min_cost_per_task else 0,
-            "max_total_possible_cost": sum(max_cost_per_task) if max_cost_per_task else 0,
-            "cost_matrix": self.costs # For detailed context in NL generation
-        }
+            "min_total_possible_cost": sum(map(min, cost_per_task)),
+            "max_total_possible_cost": sum(map(max, cost_per_task)),
+        } # Scalars only: costs is already a top-level field of to_dict()
         if self.max_cost_target is not None:
             parameters["max_cost_target"] = self.max_cost_target
             parameters["problem_type"] = "CSP"
@@ -56,7 +61,7 @@ class TaskAssignmentProblem(BaseProblem):
             "problem": "TaskAssignment",
             "num_agents": self.num_agents,
             "num_tasks": self.num_tasks,
-            "costs": self.costs,
+            "costs": [row.tolist() for row in self.costs],
             "max_cost_target": self.max_cost_target,
             "derived_parameters": self.parameters
         }
@@ -74,8 +79,9 @@ class TaskAssignmentProblem(BaseProblem):
         )
 
     def _normalized_data(self):
-        # Canonicalize costs as tuple of tuples
-        costs_norm = tuple(tuple(row) for row in self.costs)
+        # Canonicalize costs as one packed bytes string per row. Called once per
+        # instance: BaseProblem._fingerprint caches the result for hashing and dedup
+        costs_norm = tuple(map(array.tobytes, self.costs))
         return {
             'num_agents': self.num_agents,
             'num_tasks': self.num_tasks,
@@ -1,9 +1,26 @@
 import json
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from csp_cop_src.problems.job_shop_scheduling import JobShopSchedulingProblem
 from csp_cop_src.answer_parsers.job_shop_answer_parser import parse_job_shop
 from csp_cop_src.validators.job_shop_scheduling_validator import validate_job_shop_solution
 
+# Every rollout of a prompt carries the same ground-truth string; keep the parsed problems of recent prompts
+GROUND_TRUTH_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=GROUND_TRUTH_CACHE_SIZE)
+def _parse_ground_truth(ground_truth: str) -> JobShopSchedulingProblem:
+    """Builds the problem from a ground-truth JSON string. The validator never mutates it, so it is shared."""
+    # Expected to be a dict with keys "example_solution" and "problem"
+    data = orjson.loads(ground_truth) if orjson is not None else json.loads(ground_truth)
+    return JobShopSchedulingProblem.from_dict(data['problem'])
+
 
 def compute_score(solution_str, ground_truth):
     """The scoring function for GSM8k.
@@ -17,14 +34,10 @@ def compute_score(solution_str, ground_truth):
         format_score: the score for the format
         score: the score for the correct answer
     """
-    model_solution = parse_job_shop(solution_str)
+    problem = _parse_ground_truth(ground_truth)
+    model_solution = parse_job_shop(solution_str, problem.problem_id)
     if model_solution is None:
         return 0
 
-    # Expected to be a dict with keys "example_solution" and "problem"
-    ground_truth = json.loads(ground_truth)
-    valid_solution, _, _ = validate_job_shop_solution(
-        JobShopSchedulingProblem.from_json(ground_truth['problem']),
-        model_solution
-    )
+    valid_solution, _, _ = validate_job_shop_solution(problem, model_solution, collect_messages=False, fast_fail=True)
     return int(valid_solution)
\ No newline at end of file
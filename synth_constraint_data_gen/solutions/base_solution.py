@@ -2,6 +2,18 @@ import json
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 
+# orjson encodes/decodes in C; fall back to the stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _int_keyed(raw) -> Dict[int, Any]:
+    """Rebuilds an int-keyed dict from [key, value] pairs, or from a legacy string-keyed JSON object."""
+    if isinstance(raw, dict):
+        return dict(zip(map(int, raw), raw.values()))
+    return dict(raw)
+
 class SolutionStatus:
     """Enum-like class for solution status."""
     OPTIMAL = "OPTIMAL"
@@ -10,11 +22,19 @@ class SolutionStatus:
     NOT_SOLVED = "NOT_SOLVED"
     UNKNOWN = "UNKNOWN"
 
+# Maps any equal status string (e.g. fresh from JSON) to the canonical SolutionStatus object,
+# so bulk-loaded solutions share one string per status
+_STATUS_CANONICAL = {s: s for s in (SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE, SolutionStatus.INFEASIBLE,
+                                    SolutionStatus.NOT_SOLVED, SolutionStatus.UNKNOWN)}
+
 class BaseSolution(ABC):
     """
     Abstract base class for all problem solution types.
     Defines common interface for solution instances.
     """
+    # Thousands of solutions are held at once during dataset creation; no per-instance __dict__
+    __slots__ = ('problem_id', 'status', 'optimal_value')
+
     def __init__(self, problem_id: str, status: str = SolutionStatus.NOT_SOLVED, optimal_value: Optional[Any] = None):
         """
         Initializes the base solution.
@@ -25,7 +45,7 @@ class BaseSolution(ABC):
             optimal_value (Any, optional): The optimal value if the problem was a COP and solved optimally.
         """
         self.problem_id = problem_id
-        self.status = status
+        self.status = _STATUS_CANONICAL.get(status, status)
         self.optimal_value = optimal_value
 
     @abstractmethod
@@ -41,20 +61,35 @@ class BaseSolution(ABC):
         # Common fields will be extracted here by concrete implementations
         pass
 
-    def to_jsons(self) -> str:
-        """Serializes the solution instance to a JSON string."""
-        return json.dumps(self.to_dict(), indent=4)
+    def _to_json_bytes(self) -> bytes:
+        """Compact JSON encoding of to_dict(), for machine-consumed output."""
+        if orjson is not None:
+            # Schedules/bins are keyed by int ids, which orjson only accepts with OPT_NON_STR_KEYS
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode()
+
+    def to_jsons(self, pretty: bool = False) -> str:
+        """Serializes the solution instance to a JSON string. Set pretty for indented output."""
+        if pretty:
+            if orjson is not None:
+                return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+            return json.dumps(self.to_dict(), indent=2)
+        return self._to_json_bytes().decode()
 
     @classmethod
     def from_jsons(cls, json_str: str):
         """Deserializes a solution instance from a JSON string."""
-        data = json.loads(json_str)
+        data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
         return cls.from_dict(data)
 
-    def to_json(self, filepath: str):
+    def to_json(self, filepath: str, pretty: bool = False):
         """Saves the solution instance to a JSON file."""
-        with open(filepath, 'w') as f:
-            f.write(self.to_jsons())
+        if pretty:
+            with open(filepath, 'w') as f:
+                f.write(self.to_jsons(pretty=True))
+            return
+        with open(filepath, 'wb') as f:
+            f.write(self._to_json_bytes())
 
     @classmethod
     def from_json(cls, filepath: str):
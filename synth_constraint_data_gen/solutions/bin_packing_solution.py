@@ -1,17 +1,18 @@
 import json
 from typing import Dict, Any, List, Optional
-from csp_cop_src.solutions.base_solution import BaseSolution, SolutionStatus
+from csp_cop_src.solutions.base_solution import BaseSolution, SolutionStatus, _int_keyed
 
 class BinPackingSolution(BaseSolution):
     """
     Represents a solution to a Bin Packing Problem.
     """
+    __slots__ = ('bins',)
+
     def __init__(self,
                  problem_id: str,
                  status: str,
                  num_bins_used: Optional[int],
                  bins: Dict[int, List[int]], # {bin_id: [item_idx1, item_idx2, ...]}
-                 bin_contents_weights: Dict[int, List[int]], # {bin_id: [item_weight1, item_weight2, ...]}
                  ):
         """
         Initializes a Bin Packing Solution instance.
@@ -21,19 +22,22 @@ class BinPackingSolution(BaseSolution):
             status (str): The status of the solution.
             num_bins_used (Optional[int]): The number of bins used in this solution.
             bins (Dict[int, List[int]]): A dictionary mapping bin_id to a list of item_indices it contains.
-            bin_contents_weights (Dict[int, List[int]]): A dictionary mapping bin_id to a list of actual item weights.
-                                                         This is redundant if `item_sizes` from the problem is easily
-                                                         available, but useful for quick validation/display.
+                                         Per-bin item weights are not stored; use `weights(item_sizes)`.
         """
         super().__init__(problem_id, status, num_bins_used) # num_bins_used is the optimal_value for COP
         if not isinstance(bins, dict) or not all(isinstance(k, int) and isinstance(v, list) for k, v in bins.items()):
             raise ValueError("bins must be a dictionary mapping int bin_id to list of item_indices.")
-        if not isinstance(bin_contents_weights, dict) or not all(isinstance(k, int) and isinstance(v, list) for k, v in bin_contents_weights.items()):
-             raise ValueError("bin_contents_weights must be a dictionary mapping int bin_id to list of item_weights.")
 
-        self.num_bins_used = num_bins_used # Alias for clarity
         self.bins = bins
-        self.bin_contents_weights = bin_contents_weights
+
+    def weights(self, item_sizes: List[int]) -> Dict[int, List[int]]:
+        """Reconstructs {bin_id: [item_weight1, ...]} from the problem's item_sizes."""
+        return {b: [item_sizes[i] for i in items] for b, items in self.bins.items()}
+
+    @property
+    def num_bins_used(self) -> Optional[int]:
+        """The number of bins used; an alias of optimal_value."""
+        return self.optimal_value
 
     def to_dict(self) -> Dict[str, Any]:
         """Converts the Bin Packing solution instance to a dictionary."""
@@ -42,8 +46,7 @@ class BinPackingSolution(BaseSolution):
             "problem_id": self.problem_id,
             "status": self.status,
             "num_bins_used": self.num_bins_used,
-            "bins": self.bins,
-            "bin_contents_weights": self.bin_contents_weights,
+            "bins": list(self.bins.items()), # [[bin_id, [item_idx, ...]], ...]: JSON keeps the ints
         }
 
     @classmethod
@@ -55,6 +58,5 @@ class BinPackingSolution(BaseSolution):
             problem_id=data["problem_id"],
             status=data["status"],
             num_bins_used=data["num_bins_used"],
-            bins={int(k): v for k, v in data["bins"].items()}, # Ensure keys are ints
-            bin_contents_weights={int(k): v for k, v in data["bin_contents_weights"].items()} # Ensure keys are ints
+            bins=_int_keyed(data["bins"])
         )
\ No newline at end of file
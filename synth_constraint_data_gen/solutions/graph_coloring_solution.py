@@ -1,11 +1,13 @@
 import json
 from typing import Dict, Any, List, Optional
-from csp_cop_src.solutions.base_solution import BaseSolution, SolutionStatus
+from csp_cop_src.solutions.base_solution import BaseSolution, SolutionStatus, _int_keyed
 
 class GraphColoringSolution(BaseSolution):
     """
     Represents a solution to a Graph Coloring Problem.
     """
+    __slots__ = ('node_colors',)
+
     def __init__(self,
                  problem_id: str,
                  status: str,
@@ -26,7 +28,11 @@ class GraphColoringSolution(BaseSolution):
         if not isinstance(node_colors, dict) or not all(isinstance(k, int) and isinstance(v, int) for k, v in node_colors.items()):
             raise ValueError("node_colors must be a dictionary mapping int node_id to int color_id.")
         self.node_colors = node_colors
-        self.colors_used = num_colors_used # Alias for clarity
+
+    @property
+    def colors_used(self) -> Optional[int]:
+        """The number of colors used; an alias of optimal_value."""
+        return self.optimal_value
 
     def to_dict(self) -> Dict[str, Any]:
         """Converts the Graph Coloring solution instance to a dictionary."""
@@ -35,7 +41,7 @@ class GraphColoringSolution(BaseSolution):
             "problem_id": self.problem_id,
             "status": self.status,
             "num_colors_used": self.colors_used,
-            "node_colors": self.node_colors,
+            "node_colors": list(self.node_colors.items()), # [[node_id, color_id], ...]: JSON keeps the ints
         }
 
     @classmethod
@@ -47,5 +53,5 @@ class GraphColoringSolution(BaseSolution):
             problem_id=data["problem_id"],
             status=data["status"],
             num_colors_used=data["num_colors_used"],
-            node_colors={int(k): v for k, v in data["node_colors"].items()} # Ensure keys are ints if they come as strings
+            node_colors=_int_keyed(data["node_colors"])
         )
\ No newline at end of file
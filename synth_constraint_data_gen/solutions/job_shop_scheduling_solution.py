@@ -9,6 +9,8 @@ class ScheduledTask:
     """
     Represents a scheduled task in the solution schedule.
     """
+    __slots__ = ('task_idx', 'machine_id', 'start', 'end', 'duration')
+
     def __init__(self, task_idx: int, machine_id: int, start: int, end: int, duration: Optional[int] = None):
         self.task_idx = task_idx
         self.machine_id = machine_id
@@ -27,18 +29,15 @@ class ScheduledTask:
 
     @classmethod
     def from_dict(cls, data: Dict[str, int]):
-        return cls(
-            task_idx=data["task_idx"],
-            machine_id=data["machine_id"],
-            start=data["start"],
-            end=data["end"],
-            duration=data.get("duration")
-        )
+        # Positional: keyword-argument binding roughly doubles the cost of this hot call
+        return cls(data["task_idx"], data["machine_id"], data["start"], data["end"], data.get("duration"))
 
 class JobShopSchedulingSolution(BaseSolution):
     """
     Represents a solution to a Job-Shop Scheduling Problem.
     """
+    __slots__ = ('schedule',)
+
     def __init__(self,
                  problem_id: str,
                  status: str,  # SolutionStatus
@@ -63,7 +62,11 @@ class JobShopSchedulingSolution(BaseSolution):
             if not isinstance(tasks, list) or not all(isinstance(t, ScheduledTask) for t in tasks):
                 raise ValueError("Each job's schedule must be a list of ScheduledTask objects.")
         self.schedule = schedule
-        self.makespan = optimal_makespan # Alias for clarity
+
+    @property
+    def makespan(self) -> Optional[int]:
+        """The makespan achieved by this solution; an alias of optimal_value."""
+        return self.optimal_value
 
     def to_dict(self) -> Dict[str, Any]:
         """Converts the Job-Shop Scheduling solution instance to a dictionary."""
@@ -87,8 +90,9 @@ class JobShopSchedulingSolution(BaseSolution):
             raise ValueError("Invalid solution type for JobShopSchedulingSolution.")
         # Convert schedule dict of lists of dicts to dict of lists of ScheduledTask
         raw_schedule = data["schedule"]
+        task_from_dict = ScheduledTask.from_dict
         schedule = {
-            int(job_id): [ScheduledTask.from_dict(task_dict) for task_dict in tasks]
+            int(job_id): [task_from_dict(task_dict) for task_dict in tasks]
             for job_id, tasks in raw_schedule.items()
         }
         return cls(
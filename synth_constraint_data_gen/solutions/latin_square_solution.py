@@ -1,4 +1,5 @@
 import json
+from array import array
 from typing import Dict, Any, List, Optional
 from csp_cop_src.solutions.base_solution import BaseSolution, SolutionStatus
 
@@ -6,6 +7,8 @@ class LatinSquareSolution(BaseSolution):
     """
     Represents a solution to a Latin Square Problem.
     """
+    __slots__ = ('grid',)
+
     def __init__(self,
                  problem_id: str,
                  status: str,
@@ -21,9 +24,13 @@ class LatinSquareSolution(BaseSolution):
                                      Values are the symbols (e.g., 0 to N-1).
         """
         super().__init__(problem_id, status, None) # Latin Square is a pure CSP, no optimal value
-        if not (isinstance(grid, list) and all(isinstance(row, list) and all(isinstance(val, int) for val in row) for row in grid)):
+        if not (isinstance(grid, list) and all(isinstance(row, list) for row in grid)):
             raise ValueError("grid must be a list of lists of integers.")
-        self.grid = grid
+        # Rows are stored as packed int16 arrays; the conversion also rejects non-integer symbols in C
+        try:
+            self.grid: List[array] = [array('h', row) for row in grid] # grid[r][c] indexing as before
+        except (TypeError, OverflowError) as e:
+            raise ValueError("grid must be a list of lists of integers.") from e
 
     def to_dict(self) -> Dict[str, Any]:
         """Converts the Latin Square solution instance to a dictionary."""
@@ -31,7 +38,7 @@ class LatinSquareSolution(BaseSolution):
             "solution_type": "LatinSquare",
             "problem_id": self.problem_id,
             "status": self.status,
-            "grid": self.grid,
+            "grid": [row.tolist() for row in self.grid],
         }
 
     @classmethod
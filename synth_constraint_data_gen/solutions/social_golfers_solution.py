@@ -1,11 +1,13 @@
 import json
 from typing import Dict, Any, List, Optional
-from csp_cop_src.solutions.base_solution import BaseSolution, SolutionStatus
+from csp_cop_src.solutions.base_solution import BaseSolution, SolutionStatus, _int_keyed
 
 class SocialGolfersSolution(BaseSolution):
     """
     Represents a solution to the Social Golfers Problem.
     """
+    __slots__ = ('schedule',)
+
     def __init__(self,
                  problem_id: str,
                  status: str,
@@ -33,7 +35,7 @@ class SocialGolfersSolution(BaseSolution):
             "solution_type": "SocialGolfers",
             "problem_id": self.problem_id,
             "status": self.status,
-            "schedule": self.schedule,
+            "schedule": list(self.schedule.items()), # [[round, groups], ...]: JSON keeps the ints
         }
 
     @classmethod
@@ -44,5 +46,5 @@ class SocialGolfersSolution(BaseSolution):
         return cls(
             problem_id=data["problem_id"],
             status=data["status"],
-            schedule={int(k): v for k, v in data["schedule"].items()} # Ensure keys are ints
+            schedule=_int_keyed(data["schedule"])
         )
\ No newline at end of file
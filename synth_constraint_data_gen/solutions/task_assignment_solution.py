@@ -1,11 +1,13 @@
 import json
 from typing import Dict, Any, List, Optional
-from csp_cop_src.solutions.base_solution import BaseSolution, SolutionStatus
+from csp_cop_src.solutions.base_solution import BaseSolution, SolutionStatus, _int_keyed
 
 class TaskAssignmentSolution(BaseSolution):
     """
     Represents a solution to a Task Assignment Problem.
     """
+    __slots__ = ('assignments',)
+
     def __init__(self,
                  problem_id: str,
                  status: str,
@@ -25,7 +27,11 @@ class TaskAssignmentSolution(BaseSolution):
         if not isinstance(assignments, dict) or not all(isinstance(k, int) and isinstance(v, int) for k, v in assignments.items()):
             raise ValueError("assignments must be a dictionary mapping int task_id to int agent_id.")
         self.assignments = assignments
-        self.cost = total_cost # Alias for clarity
+
+    @property
+    def cost(self) -> Optional[int]:
+        """The total cost of the assignment; an alias of optimal_value."""
+        return self.optimal_value
 
     def to_dict(self) -> Dict[str, Any]:
         """Converts the Task Assignment solution instance to a dictionary."""
@@ -34,7 +40,7 @@ class TaskAssignmentSolution(BaseSolution):
             "problem_id": self.problem_id,
             "status": self.status,
             "total_cost": self.cost,
-            "assignments": self.assignments,
+            "assignments": list(self.assignments.items()), # [[task_id, agent_id], ...]: JSON keeps the ints
         }
 
     @classmethod
@@ -46,5 +52,5 @@ class TaskAssignmentSolution(BaseSolution):
             problem_id=data["problem_id"],
             status=data["status"],
             total_cost=data["total_cost"],
-            assignments={int(k): v for k, v in data["assignments"].items()} # Ensure keys are ints
+            assignments=_int_keyed(data["assignments"])
         )
@@ -0,0 +1,97 @@
+import copy
+import functools
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional
+
+from ortools.sat.python import cp_model
+
+from csp_cop_src.solutions.base_solution import SolutionStatus
+
+SOLUTION_CACHE_SIZE = 1024 # Solved problems remembered per solve_* function (and per process)
+# Set CSP_COP_NAME_VARIABLES=1 to give model variables readable names (e.g. for model dumps);
+# unnamed by default, since formatting a name per variable is a measurable share of model build time
+NAME_VARIABLES = os.environ.get('CSP_COP_NAME_VARIABLES') == '1'
+
+def make_solver(num_search_workers: Optional[int] = None) -> cp_model.CpSolver:
+    """
+    Builds a CpSolver that runs CP-SAT's parallel search portfolio.
+    `num_search_workers` defaults to every core; pass a smaller share when several
+    processes solve at once (e.g. one solver per dataset worker).
+    """
+    solver = cp_model.CpSolver()
+    solver.parameters.num_search_workers = num_search_workers or os.cpu_count() or 1
+    solver.parameters.log_search_progress = False
+    return solver
+
+_thread_state = threading.local()
+
+def default_solver() -> cp_model.CpSolver:
+    """
+    The calling thread's shared CpSolver, built by make_solver() on first use.
+    Solve() leaves parameters untouched, so one configured solver serves every call.
+    """
+    solver = getattr(_thread_state, 'solver', None)
+    if solver is None:
+        solver = _thread_state.solver = make_solver()
+    return solver
+
+def set_default_solver(solver: cp_model.CpSolver) -> None:
+    """
+    Makes `solver` the calling thread's default_solver(), e.g. from a pool initializer
+    that sizes num_search_workers to the process's share of the cores.
+    """
+    _thread_state.solver = solver
+
+def solution_values(solver: cp_model.CpSolver) -> List[int]:
+    """
+    Every variable's value in the last solution, indexed by `var.Index()`.
+    One response read instead of a solver.Value() call per variable.
+    """
+    return list(solver.ResponseProto().solution)
+
+def cache_by_problem_data(key: Callable[[object], Hashable]) -> Callable[[Callable], Callable]:
+    """
+    Memoizes `solve(problem, solver=None)` on `key(problem)`, a hashable tuple of the
+    problem's defining fields in order (not problem_id or derived parameters), so
+    identical problems are solved once. Not _fingerprint(), which canonicalizes
+    task/item order away: solutions refer to tasks and items by index, so they only
+    carry over between identical instances.
+
+    A hit returns a deep copy re-stamped with the new problem_id, so callers may
+    mutate it. Undecided results (UNKNOWN, NOT_SOLVED) are not cached. The cache is
+    shared by the process's threads and guarded by a lock; solves run outside it.
+    Only worth it for solvers that cost more than building the key.
+    """
+    def decorator(solve: Callable) -> Callable:
+        cache: "OrderedDict[Hashable, object]" = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(solve)
+        def wrapper(problem, solver: Optional[cp_model.CpSolver] = None):
+            problem_key = key(problem)
+            with lock:
+                cached = cache.get(problem_key)
+                if cached is not None:
+                    cache.move_to_end(problem_key)
+            if cached is None:
+                cached = solve(problem, solver)
+                if cached.status in (SolutionStatus.UNKNOWN, SolutionStatus.NOT_SOLVED):
+                    return cached
+                with lock:
+                    cache[problem_key] = cached
+                    if len(cache) > SOLUTION_CACHE_SIZE:
+                        cache.popitem(last=False)
+            solution = copy.deepcopy(cached)
+            solution.problem_id = problem.problem_id
+            return solution
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
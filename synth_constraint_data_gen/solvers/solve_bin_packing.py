@@ -4,10 +4,36 @@ from typing import Dict, List, Optional, Tuple
 from csp_cop_src.problems.bin_packing import BinPackingProblem
 from csp_cop_src.solutions.base_solution import SolutionStatus
 from csp_cop_src.solutions.bin_packing_solution import BinPackingSolution
-
-def solve_bin_packing(problem: BinPackingProblem) -> BinPackingSolution:
+from csp_cop_src.solvers.cp_sat import NAME_VARIABLES, cache_by_problem_data, default_solver, solution_values
+
+def _first_fit_decreasing(item_sizes: List[int], bin_capacity: int) -> List[int]:
+    """Bin index per item from First-Fit Decreasing; bins are numbered in the order they open."""
+    loads: List[int] = []
+    item_bins = [0] * len(item_sizes)
+    for i in sorted(range(len(item_sizes)), key=item_sizes.__getitem__, reverse=True):
+        size = item_sizes[i]
+        for b, load in enumerate(loads):
+            if load + size <= bin_capacity:
+                loads[b] += size
+                item_bins[i] = b
+                break
+        else:
+            loads.append(size)
+            item_bins[i] = len(loads) - 1
+    return item_bins
+
+def _problem_key(problem: BinPackingProblem) -> Tuple:
+    """Solution cache key: the fields that define the instance, item order kept."""
+    return (problem.bin_capacity, tuple(problem.item_sizes), problem.num_bins_target)
+
+@cache_by_problem_data(_problem_key)
+def solve_bin_packing(
+    problem: BinPackingProblem,
+    solver: Optional[cp_model.CpSolver] = None,
+) -> BinPackingSolution:
     """
     Solves a Bin Packing Problem using OR-Tools CP-SAT solver.
+    Pass `solver` to reuse one CpSolver across many problems.
     """
     model = cp_model.CpModel()
 
@@ -18,26 +44,49 @@ def solve_bin_packing(problem: BinPackingProblem) -> BinPackingSolution:
     max_num_bins_upper_bound = num_items
     min_num_bins_lower_bound = (sum(item_sizes) + bin_capacity - 1) // bin_capacity
 
-    # Variables:
+    # Variables: y[b] followed by x[(i, b)] for every item, so each bin's items are contiguous
     x: Dict[Tuple[int, int], cp_model.BoolVar] = {}
     y: Dict[int, cp_model.BoolVar] = {}
 
     if problem.num_bins_target is not None:
         max_num_bins_upper_bound = problem.num_bins_target
 
+    new_bool_var = model.NewBoolVar # Bound once; looked up per variable otherwise
     for b in range(max_num_bins_upper_bound):
-        y[b] = model.NewBoolVar(f'y_{b}')
+        y[b] = new_bool_var(f'y_{b}' if NAME_VARIABLES else '')
         for i in range(num_items):
-            x[(i, b)] = model.NewBoolVar(f'x_{i},{b}')
+            x[(i, b)] = new_bool_var(f'x_{i},{b}' if NAME_VARIABLES else '')
 
     # Constraints:
     # 1. Each item must be placed in exactly one bin.
     for i in range(num_items):
-        model.Add(sum(x[(i, b)] for b in range(max_num_bins_upper_bound)) == 1)
+        model.AddExactlyOne(x[(i, b)] for b in range(max_num_bins_upper_bound))
 
     # 2. Bin capacity constraint
     for b in range(max_num_bins_upper_bound):
-        model.Add(sum(x[(i, b)] * item_sizes[i] for i in range(num_items)) <= bin_capacity * y[b])
+        model.Add(cp_model.LinearExpr.WeightedSum([x[(i, b)] for i in range(num_items)], item_sizes)
+                  <= bin_capacity * y[b])
+        # Redundant with the big-M row above, but propagates "item in bin => bin used" as a clause
+        for i in range(num_items):
+            model.AddImplication(x[(i, b)], y[b])
+
+    # 3. Redundant volume bound: the used bins must hold the total item size
+    bins_used = cp_model.LinearExpr.Sum([y[b] for b in range(max_num_bins_upper_bound)])
+    model.Add(bin_capacity * bins_used >= sum(item_sizes))
+
+    # 4. Symmetry breaking: bins are interchangeable, so the used ones come first
+    for b in range(max_num_bins_upper_bound - 1):
+        model.AddImplication(y[b + 1], y[b])
+
+    # Warm start from First-Fit Decreasing when it fits in the available bins; its bins
+    # open in order, so the hint also satisfies the symmetry breaking above
+    item_bins = _first_fit_decreasing(item_sizes, bin_capacity)
+    if item_bins and max(item_bins) < max_num_bins_upper_bound:
+        used = set(item_bins)
+        for b in range(max_num_bins_upper_bound):
+            model.AddHint(y[b], b in used)
+            for i in range(num_items):
+                model.AddHint(x[(i, b)], item_bins[i] == b)
 
     # Objective: Minimize the number of used bins (for COP)
     objective_is_minimized = False
@@ -45,39 +94,33 @@ def solve_bin_packing(problem: BinPackingProblem) -> BinPackingSolution:
 
     if problem.num_bins_target is None:
         num_bins_used_var = model.NewIntVar(min_num_bins_lower_bound, max_num_bins_upper_bound, 'num_bins_used')
-        model.Add(num_bins_used_var == sum(y[b] for b in range(max_num_bins_upper_bound)))
+        model.Add(num_bins_used_var == bins_used)
         model.Minimize(num_bins_used_var)
         objective_is_minimized = True
 
     # Solve the model
-    solver = cp_model.CpSolver()
+    if solver is None:
+        solver = default_solver()
     status = solver.Solve(model)
 
     solution_status: str = SolutionStatus.NOT_SOLVED
     num_bins_used: Optional[int] = None
     bins: Dict[int, List[int]] = {}
-    bin_contents_weights: Dict[int, List[int]] = {}
 
     if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
         solution_status = SolutionStatus.OPTIMAL if status == cp_model.OPTIMAL else SolutionStatus.FEASIBLE
 
+        values = solution_values(solver)
+        used_bins = [b for b in range(max_num_bins_upper_bound) if values[y[b].Index()] == 1]
+
         if objective_is_minimized:
             num_bins_used = int(solver.ObjectiveValue())
         else:
-            used_bins_count = 0
-            for b in range(max_num_bins_upper_bound):
-                if solver.Value(y[b]) == 1:
-                    used_bins_count += 1
-            num_bins_used = used_bins_count
+            num_bins_used = len(used_bins)
 
-        for b in range(max_num_bins_upper_bound):
-            if solver.Value(y[b]) == 1:
-                bins[b] = []
-                bin_contents_weights[b] = []
-                for i in range(num_items):
-                    if solver.Value(x[(i, b)]) == 1:
-                        bins[b].append(i)
-                        bin_contents_weights[b].append(item_sizes[i])
+        for b in used_bins:
+            first = x[(0, b)].Index()
+            bins[b] = [i for i, value in enumerate(values[first:first + num_items]) if value]
 
     elif status == cp_model.INFEASIBLE:
         solution_status = SolutionStatus.INFEASIBLE
@@ -88,6 +131,5 @@ def solve_bin_packing(problem: BinPackingProblem) -> BinPackingSolution:
         problem_id=problem.problem_id,
         status=solution_status,
         num_bins_used=num_bins_used,
-        bins=bins,
-        bin_contents_weights=bin_contents_weights
+        bins=bins
     )
@@ -1,44 +1,110 @@
+import heapq
+
 from ortools.sat.python import cp_model
 from typing import Dict, List, Optional, Tuple
 
 from csp_cop_src.problems.graph_coloring import GraphColoringProblem
 from csp_cop_src.solutions.base_solution import SolutionStatus
 from csp_cop_src.solutions.graph_coloring_solution import GraphColoringSolution
+from csp_cop_src.solvers.cp_sat import NAME_VARIABLES, cache_by_problem_data, default_solver, solution_values
+
+def _dsatur_coloring(num_nodes: int, edges: List[Tuple[int, int]]) -> List[int]:
+    """
+    Greedy DSATUR coloring: repeatedly color the node with the most distinct neighbor
+    colors (ties: highest degree) with its smallest free color. Colors are then
+    renumbered by first use in node order, matching the solver's symmetry breaking.
+    """
+    adjacency = [set() for _ in range(num_nodes)]
+    for u, v in edges:
+        if u != v:
+            adjacency[u].add(v)
+            adjacency[v].add(u)
+    colors = [-1] * num_nodes
+    neighbor_colors = [set() for _ in range(num_nodes)]
+    # Max-heap on (saturation, degree, -node) via negated keys; a node is re-pushed whenever
+    # its saturation grows and stale entries are skipped on pop, instead of rescanning
+    # every uncolored node per step
+    heap = [(0, -len(adjacency[i]), i) for i in range(num_nodes)]
+    heapq.heapify(heap)
+    while heap:
+        neg_saturation, _, node = heapq.heappop(heap)
+        if colors[node] != -1 or -neg_saturation != len(neighbor_colors[node]):
+            continue
+        taken = neighbor_colors[node]
+        color = 0
+        while color in taken:
+            color += 1
+        colors[node] = color
+        for neighbor in adjacency[node]:
+            if colors[neighbor] == -1 and color not in neighbor_colors[neighbor]:
+                neighbor_colors[neighbor].add(color)
+                heapq.heappush(heap, (-len(neighbor_colors[neighbor]), -len(adjacency[neighbor]), neighbor))
+    relabel: Dict[int, int] = {}
+    return [relabel.setdefault(c, len(relabel)) for c in colors]
 
-def solve_graph_coloring(problem: GraphColoringProblem) -> GraphColoringSolution:
+def _problem_key(problem: GraphColoringProblem) -> Tuple:
+    """Solution cache key: the fields that define the instance (edges are stored as sorted tuples)."""
+    return (problem.num_nodes, tuple(problem.edges), problem.num_colors_target)
+
+@cache_by_problem_data(_problem_key)
+def solve_graph_coloring(
+    problem: GraphColoringProblem,
+    solver: Optional[cp_model.CpSolver] = None,
+) -> GraphColoringSolution:
     """
     Solves a Graph Coloring Problem using OR-Tools CP-SAT solver.
+    Pass `solver` to reuse one CpSolver across many problems.
     """
     model = cp_model.CpModel()
 
     num_nodes = problem.num_nodes
     edges = problem.edges
 
-    max_colors_upper_bound = num_nodes
+    # A DSATUR coloring is feasible, so for COPs its color count bounds the optimum
+    greedy_colors = _dsatur_coloring(num_nodes, edges)
+    max_colors_upper_bound = max(greedy_colors) + 1
     if problem.num_colors_target is not None:
         max_colors_upper_bound = problem.num_colors_target
 
-    # Variables: colors for each node
-    node_vars: Dict[int, cp_model.IntVar] = {}
-    for i in range(num_nodes):
-        node_vars[i] = model.NewIntVar(0, max_colors_upper_bound - 1, f'node_color_{i}')
+    # Variables: colors for each node, created back to back so their indices are contiguous
+    new_int_var = model.NewIntVar # Bound once; looked up per variable otherwise
+    node_vars: List[cp_model.IntVar] = [
+        new_int_var(0, max_colors_upper_bound - 1, f'node_color_{i}' if NAME_VARIABLES else '') for i in range(num_nodes)
+    ]
 
     # Constraints: adjacent nodes must have different colors
     for u, v in edges:
         model.Add(node_vars[u] != node_vars[v])
 
+    # Symmetry breaking: colors are interchangeable, so number them in order of first use.
+    # Node i may use at most one color above the highest among nodes 0..i-1.
+    model.Add(node_vars[0] == 0)
+    prefix_max = node_vars[0]
+    for i in range(1, num_nodes):
+        model.Add(node_vars[i] <= prefix_max + 1)
+        if i < num_nodes - 1:
+            next_prefix_max = model.NewIntVar(0, max_colors_upper_bound - 1, f'prefix_max_{i}' if NAME_VARIABLES else '')
+            model.AddMaxEquality(next_prefix_max, [prefix_max, node_vars[i]])
+            prefix_max = next_prefix_max
+
+    # Warm start from a DSATUR coloring when it fits in the available colors
+    if max(greedy_colors) < max_colors_upper_bound:
+        for i, color in enumerate(greedy_colors):
+            model.AddHint(node_vars[i], color)
+
     # Objective: Minimize the number of colors used (for COP)
     objective_is_minimized = False
     num_colors_used_var: Optional[cp_model.IntVar] = None
 
     if problem.num_colors_target is None:
         num_colors_used_var = model.NewIntVar(0, max_colors_upper_bound - 1, 'num_colors_used')
-        model.AddMaxEquality(num_colors_used_var, [node_vars[i] for i in range(num_nodes)])
+        model.AddMaxEquality(num_colors_used_var, node_vars)
         model.Minimize(num_colors_used_var)
         objective_is_minimized = True
 
     # Solve the model
-    solver = cp_model.CpSolver()
+    if solver is None:
+        solver = default_solver()
     status = solver.Solve(model)
 
     solution_status: str = SolutionStatus.NOT_SOLVED
@@ -48,22 +114,18 @@ def solve_graph_coloring(problem: GraphColoringProblem) -> GraphColoringSolution
     if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
         solution_status = SolutionStatus.OPTIMAL if status == cp_model.OPTIMAL else SolutionStatus.FEASIBLE
 
+        values = solution_values(solver)
+        first = node_vars[0].Index()
+        node_colors = dict(enumerate(values[first:first + num_nodes]))
+
         if objective_is_minimized:
             num_colors_used = int(solver.ObjectiveValue()) + 1
         else:
             if problem.num_colors_target is not None:
-                actual_colors = set()
-                for i in range(num_nodes):
-                    color = int(solver.Value(node_vars[i]))
-                    node_colors[i] = color
-                    actual_colors.add(color)
-                num_colors_used = len(actual_colors)
+                num_colors_used = len(set(node_colors.values()))
             else:
                 num_colors_used = 0
 
-        for i in range(num_nodes):
-            node_colors[i] = int(solver.Value(node_vars[i]))
-
     elif status == cp_model.INFEASIBLE:
         solution_status = SolutionStatus.INFEASIBLE
     else:
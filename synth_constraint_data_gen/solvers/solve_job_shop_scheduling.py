@@ -4,10 +4,50 @@ from typing import Dict, List, Optional, Tuple
 from csp_cop_src.problems.job_shop_scheduling import JobShopSchedulingProblem, Job, Task
 from csp_cop_src.solutions.base_solution import SolutionStatus
 from csp_cop_src.solutions.job_shop_scheduling_solution import JobShopSchedulingSolution, ScheduledTask
+from csp_cop_src.solvers.cp_sat import NAME_VARIABLES, cache_by_problem_data, default_solver, solution_values
 
-def solve_job_shop_scheduling(problem: JobShopSchedulingProblem) -> JobShopSchedulingSolution:
+def greedy_makespan(jobs: List[Job]) -> int:
+    """
+    Makespan of a feasible schedule built greedily: repeatedly start the pending
+    task (each job's next one) that can begin earliest, shorter first on ties.
+    Being feasible, it is an upper bound on the optimal makespan.
+    """
+    next_task = [0] * len(jobs)
+    job_ready = [0] * len(jobs)
+    machine_ready: Dict[int, int] = {}
+    remaining = sum(len(job.tasks) for job in jobs)
+    makespan = 0
+    while remaining:
+        best = None
+        for j, job in enumerate(jobs):
+            if next_task[j] == len(job.tasks):
+                continue
+            task = job.tasks[next_task[j]]
+            start = max(job_ready[j], machine_ready.get(task.machine_id, 0))
+            key = (start, task.duration, j)
+            if best is None or key < best:
+                best = key
+        start, duration, j = best
+        end = start + duration
+        job_ready[j] = end
+        machine_ready[jobs[j].tasks[next_task[j]].machine_id] = end
+        next_task[j] += 1
+        remaining -= 1
+        makespan = max(makespan, end)
+    return makespan
+
+def _problem_key(problem: JobShopSchedulingProblem) -> Tuple:
+    """Solution cache key: each job's (machine_id, duration) tasks in order, and the target."""
+    return (tuple(map(tuple, problem.parameters["jobs_description"])), problem.makespan_target)
+
+@cache_by_problem_data(_problem_key)
+def solve_job_shop_scheduling(
+    problem: JobShopSchedulingProblem,
+    solver: Optional[cp_model.CpSolver] = None,
+) -> JobShopSchedulingSolution:
     """
     Solves a Job-Shop Scheduling Problem using OR-Tools CP-SAT solver.
+    Pass `solver` to reuse one CpSolver across many problems (e.g. one per worker process).
     """
     model = cp_model.CpModel()
 
@@ -16,31 +56,55 @@ def solve_job_shop_scheduling(problem: JobShopSchedulingProblem) -> JobShopSched
     num_jobs = problem.num_jobs
     num_machines = problem.num_machines
 
-    # Calculate horizon (upper bound for makespan)
-    horizon = 0
+    # Horizon (upper bound for makespan): a feasible greedy schedule, and no more than the
+    # target for CSPs. Lower bound: the longest job or the most loaded machine.
+    horizon = greedy_makespan(all_jobs)
+    if problem.makespan_target is not None:
+        horizon = min(horizon, problem.makespan_target)
+    machine_load: Dict[int, int] = {}
     for job in all_jobs:
-        horizon += sum(task.duration for task in job.tasks)
-
-    # Variables:
-    intervals = {}
-    start_vars = {}
-    end_vars = {}
+        for task in job.tasks:
+            machine_load[task.machine_id] = machine_load.get(task.machine_id, 0) + task.duration
+    lower_bound = max(max(sum(task.duration for task in job.tasks) for job in all_jobs),
+                      max(machine_load.values()))
+    if lower_bound > horizon:
+        # Only possible when the target is below a valid lower bound: provably infeasible
+        return JobShopSchedulingSolution(
+            problem_id=problem.problem_id,
+            status=SolutionStatus.INFEASIBLE,
+            optimal_makespan=None,
+            schedule={}
+        )
+
+    # Variables: start_vars[job_idx][task_idx], likewise end_vars
+    start_vars: List[List[cp_model.IntVar]] = []
+    end_vars: List[List[cp_model.IntVar]] = []
     machine_to_intervals: Dict[int, List[cp_model.IntervalVar]] = {m: [] for m in range(num_machines)}
 
+    new_int_var = model.NewIntVar # Bound once; looked up per variable otherwise
+    new_interval_var = model.NewIntervalVar
     for job_idx, job in enumerate(all_jobs):
+        # Each task starts after its job's earlier tasks (head) and must leave room for the later ones (tail)
+        head = 0
+        tail = sum(task.duration for task in job.tasks)
+        job_starts: List[cp_model.IntVar] = []
+        job_ends: List[cp_model.IntVar] = []
         for task_idx, task in enumerate(job.tasks):
             machine_id = task.machine_id
             duration = task.duration
 
-            suffix = f'_{job_idx}_{task_idx}'
-            start = model.NewIntVar(0, horizon, f'start{suffix}')
-            end = model.NewIntVar(0, horizon, f'end{suffix}')
-            interval = model.NewIntervalVar(start, duration, end, f'interval{suffix}')
+            suffix = f'_{job_idx}_{task_idx}' if NAME_VARIABLES else ''
+            start = new_int_var(head, horizon - tail, suffix and f'start{suffix}')
+            end = new_int_var(head + duration, horizon - tail + duration, suffix and f'end{suffix}')
+            head += duration
+            tail -= duration
+            interval = new_interval_var(start, duration, end, suffix and f'interval{suffix}')
 
-            start_vars[(job_idx, task_idx)] = start
-            end_vars[(job_idx, task_idx)] = end
-            intervals[(job_idx, task_idx)] = interval
+            job_starts.append(start)
+            job_ends.append(end)
             machine_to_intervals[machine_id].append(interval)
+        start_vars.append(job_starts)
+        end_vars.append(job_ends)
 
     # Constraints:
     # 1. No overlap on machines
@@ -49,13 +113,14 @@ def solve_job_shop_scheduling(problem: JobShopSchedulingProblem) -> JobShopSched
             model.AddNoOverlap(machine_to_intervals[machine_id])
 
     # 2. Task precedence within each job
-    for job_idx, job in enumerate(all_jobs):
-        for task_idx in range(len(job.tasks) - 1):
-            model.Add(start_vars[(job_idx, task_idx + 1)] >= end_vars[(job_idx, task_idx)])
+    for job_starts, job_ends in zip(start_vars, end_vars):
+        for next_start, end in zip(job_starts[1:], job_ends):
+            model.Add(next_start >= end)
 
     # Objective: Minimize makespan
-    makespan = model.NewIntVar(0, horizon, 'makespan')
-    model.AddMaxEquality(makespan, [end_vars[key] for key in end_vars])
+    makespan = model.NewIntVar(lower_bound, horizon, 'makespan')
+    # Precedence makes each job's last task finish last, so only those ends enter the max
+    model.AddMaxEquality(makespan, [job_ends[-1] for job_ends in end_vars if job_ends])
 
     objective_is_minimized = False
     if problem.makespan_target is not None:
@@ -65,7 +130,8 @@ def solve_job_shop_scheduling(problem: JobShopSchedulingProblem) -> JobShopSched
         objective_is_minimized = True
 
     # Solve the model
-    solver = cp_model.CpSolver()
+    if solver is None:
+        solver = default_solver()
     status = solver.Solve(model)
 
     solution_status: str = SolutionStatus.NOT_SOLVED
@@ -76,17 +142,18 @@ def solve_job_shop_scheduling(problem: JobShopSchedulingProblem) -> JobShopSched
         solution_status = SolutionStatus.OPTIMAL if status == cp_model.OPTIMAL else SolutionStatus.FEASIBLE
         optimal_makespan = int(solver.ObjectiveValue()) if objective_is_minimized else int(solver.Value(makespan))
 
+        values = solution_values(solver)
         for job_idx, job in enumerate(all_jobs):
-            schedule[job_idx] = []
-            for task_idx, task in enumerate(job.tasks):
-                scheduled_task = ScheduledTask(
+            schedule[job_idx] = [
+                ScheduledTask(
                     task_idx=task_idx,
                     machine_id=task.machine_id,
-                    start=int(solver.Value(start_vars[(job_idx, task_idx)])),
-                    end=int(solver.Value(end_vars[(job_idx, task_idx)])),
+                    start=values[start.Index()],
+                    end=values[end.Index()],
                     duration=task.duration
                 )
-                schedule[job_idx].append(scheduled_task)
+                for task_idx, (task, start, end) in enumerate(zip(job.tasks, start_vars[job_idx], end_vars[job_idx]))
+            ]
     elif status == cp_model.INFEASIBLE:
         solution_status = SolutionStatus.INFEASIBLE
     else:
@@ -4,11 +4,21 @@ from typing import Dict, List, Optional, Tuple
 from csp_cop_src.problems.social_golfers import SocialGolfersProblem
 from csp_cop_src.solutions.base_solution import SolutionStatus
 from csp_cop_src.solutions.social_golfers_solution import SocialGolfersSolution
+from csp_cop_src.solvers.cp_sat import NAME_VARIABLES, cache_by_problem_data, default_solver, solution_values
 
-def solve_social_golfers(problem: SocialGolfersProblem) -> SocialGolfersSolution:
+def _problem_key(problem: SocialGolfersProblem) -> Tuple:
+    """Solution cache key: the fields that define the instance."""
+    return (problem.num_golfers, problem.num_groups, problem.group_size, problem.num_rounds)
+
+@cache_by_problem_data(_problem_key)
+def solve_social_golfers(
+    problem: SocialGolfersProblem,
+    solver: Optional[cp_model.CpSolver] = None,
+) -> SocialGolfersSolution:
     """
     Solves the Social Golfers Problem using OR-Tools CP-SAT solver.
     This is a pure CSP.
+    Pass `solver` to reuse one CpSolver across many problems.
     """
     model = cp_model.CpModel()
 
@@ -18,40 +28,59 @@ def solve_social_golfers(problem: SocialGolfersProblem) -> SocialGolfersSolution
     num_rounds = problem.num_rounds
 
     # Variables: assignment[r][g] = group_id for golfer g in round r
-    assignments: Dict[Tuple[int, int], cp_model.IntVar] = {}
-    for r in range(num_rounds):
-        for g in range(num_golfers):
-            assignments[(r, g)] = model.NewIntVar(0, num_groups - 1, f'assignment_r{r}_g{g}')
+    new_int_var = model.NewIntVar # Bound once; looked up per variable otherwise
+    new_bool_var = model.NewBoolVar
+    assignments: Dict[Tuple[int, int], cp_model.IntVar] = {
+        (r, g): new_int_var(0, num_groups - 1, f'assignment_r{r}_g{g}' if NAME_VARIABLES else '')
+        for r in range(num_rounds) for g in range(num_golfers)
+    }
 
     # Variables: group_membership[r][group_idx][golfer_idx]
+    # channeled to assignments by AddMapDomain: bools[i] <=> (assignment == i)
     group_membership: Dict[Tuple[int, int, int], cp_model.BoolVar] = {}
     for r in range(num_rounds):
-        for group_idx in range(num_groups):
-            for g in range(num_golfers):
-                group_membership[(r, group_idx, g)] = model.NewBoolVar(f'group_membership_r{r}_g{g}_gr{group_idx}')
-                model.Add(assignments[(r, g)] == group_idx).OnlyEnforceIf(group_membership[(r, group_idx, g)])
-                model.Add(assignments[(r, g)] != group_idx).OnlyEnforceIf(group_membership[(r, group_idx, g)].Not())
+        for g in range(num_golfers):
+            bools = [new_bool_var(f'group_membership_r{r}_g{g}_gr{group_idx}' if NAME_VARIABLES else '') for group_idx in range(num_groups)]
+            model.AddMapDomain(assignments[(r, g)], bools)
+            for group_idx, membership in enumerate(bools):
+                group_membership[(r, group_idx, g)] = membership
 
     # Constraints:
     # 1. Each group has exactly `group_size` golfers in each round.
     for r in range(num_rounds):
         for group_idx in range(num_groups):
-            model.Add(sum(group_membership[(r, group_idx, g)] for g in range(num_golfers)) == group_size)
+            model.Add(cp_model.LinearExpr.Sum([group_membership[(r, group_idx, g)] for g in range(num_golfers)])
+                      == group_size)
 
     # 2. No two golfers play in the same group more than once.
+    # Only "both in a group => they meet" is needed: AddAtMostOne caps the meetings, so a
+    # spurious meet=1 can only tighten the model. Plain clauses over the membership booleans
+    # replace the two reified int equalities per pair and round, and propagate directly.
     for g1 in range(num_golfers):
         for g2 in range(g1 + 1, num_golfers):
             same_group_in_round_vars: List[cp_model.BoolVar] = []
             for r in range(num_rounds):
-                are_in_same_group_in_round = model.NewBoolVar(f'same_group_r{r}_g{g1}_g{g2}')
-                model.Add(assignments[(r, g1)] == assignments[(r, g2)]).OnlyEnforceIf(are_in_same_group_in_round)
-                model.Add(assignments[(r, g1)] != assignments[(r, g2)]).OnlyEnforceIf(are_in_same_group_in_round.Not())
+                are_in_same_group_in_round = new_bool_var(f'same_group_r{r}_g{g1}_g{g2}' if NAME_VARIABLES else '')
+                for group_idx in range(num_groups):
+                    model.AddBoolOr([
+                        group_membership[(r, group_idx, g1)].Not(),
+                        group_membership[(r, group_idx, g2)].Not(),
+                        are_in_same_group_in_round,
+                    ])
                 same_group_in_round_vars.append(are_in_same_group_in_round)
 
-            model.Add(sum(same_group_in_round_vars) <= 1)
+            model.AddAtMostOne(same_group_in_round_vars)
+
+    # 3. Symmetry breaking. Golfers are interchangeable, so round 0 is fixed to consecutive
+    # blocks; groups within a round are interchangeable, so golfer 0 is in group 0 every round.
+    for g in range(num_golfers):
+        model.Add(assignments[(0, g)] == g // group_size)
+    for r in range(1, num_rounds):
+        model.Add(assignments[(r, 0)] == 0)
 
     # Solve the model
-    solver = cp_model.CpSolver()
+    if solver is None:
+        solver = default_solver()
     status = solver.Solve(model)
 
     solution_status: str = SolutionStatus.NOT_SOLVED
@@ -60,10 +89,11 @@ def solve_social_golfers(problem: SocialGolfersProblem) -> SocialGolfersSolution
     if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
         solution_status = SolutionStatus.OPTIMAL if status == cp_model.OPTIMAL else SolutionStatus.FEASIBLE
 
+        values = solution_values(solver)
         for r in range(num_rounds):
             round_groups: Dict[int, List[int]] = {group_idx: [] for group_idx in range(num_groups)}
             for g in range(num_golfers):
-                assigned_group = int(solver.Value(assignments[(r, g)]))
+                assigned_group = values[assignments[(r, g)].Index()]
                 round_groups[assigned_group].append(g)
             schedule[r] = [round_groups[group_idx] for group_idx in sorted(round_groups.keys())]
 
@@ -4,35 +4,70 @@ from typing import Dict, List, Optional, Tuple
 from csp_cop_src.problems.task_assignment import TaskAssignmentProblem
 from csp_cop_src.solutions.base_solution import SolutionStatus
 from csp_cop_src.solutions.task_assignment_solution import TaskAssignmentSolution
+from csp_cop_src.solvers.cp_sat import NAME_VARIABLES, default_solver, solution_values
 
-def solve_task_assignment(problem: TaskAssignmentProblem) -> TaskAssignmentSolution:
+def solve_task_assignment(
+    problem: TaskAssignmentProblem,
+    solver: Optional[cp_model.CpSolver] = None,
+) -> TaskAssignmentSolution:
     """
     Solves a Task Assignment Problem using OR-Tools CP-SAT solver.
+    Pass `solver` to reuse one CpSolver across many problems.
     """
-    model = cp_model.CpModel()
-
     num_agents = problem.num_agents
     num_tasks = problem.num_tasks
     costs = problem.costs
 
+    # Fast path: the model only requires one agent per task (agents may take several),
+    # so with non-negative costs the cheapest agent per task is exactly optimal and the
+    # target check is a single comparison. CP-SAT is kept for negative cost markers.
+    if all(min(row) >= 0 for row in costs):
+        task_assignments = {
+            j: min(range(num_agents), key=lambda i: costs[i][j]) for j in range(num_tasks)
+        }
+        total_cost = sum(costs[i][j] for j, i in task_assignments.items())
+        if problem.max_cost_target is not None and total_cost > problem.max_cost_target:
+            return TaskAssignmentSolution(
+                problem_id=problem.problem_id,
+                status=SolutionStatus.INFEASIBLE,
+                total_cost=None,
+                assignments={}
+            )
+        return TaskAssignmentSolution(
+            problem_id=problem.problem_id,
+            status=SolutionStatus.OPTIMAL,
+            total_cost=total_cost,
+            assignments=task_assignments
+        )
+
+    model = cp_model.CpModel()
+
     # Variables: x[i][j] = 1 if agent i is assigned to task j, 0 otherwise
-    assignments: Dict[Tuple[int, int], cp_model.BoolVar] = {}
-    for i in range(num_agents):
-        for j in range(num_tasks):
-            assignments[(i, j)] = model.NewBoolVar(f'x_{i}_{j}')
+    new_bool_var = model.NewBoolVar # Bound once; looked up per variable otherwise
+    assignments: Dict[Tuple[int, int], cp_model.BoolVar] = {
+        (i, j): new_bool_var(f'x_{i}_{j}' if NAME_VARIABLES else '') for i in range(num_agents) for j in range(num_tasks)
+    }
 
     # Constraints:
     # 1. Each task must be assigned to exactly one agent.
     for j in range(num_tasks):
-        model.Add(sum(assignments[(i, j)] for i in range(num_agents)) == 1)
+        model.Add(cp_model.LinearExpr.Sum([assignments[(i, j)] for i in range(num_agents)]) == 1)
 
     # Objective: Minimize total cost
     # A safe upper bound for total_cost_var.
     # Assumes costs are non-negative.
     max_possible_cost = sum(max(row) for row in costs) if costs else 0
     total_cost_var = model.NewIntVar(0, max_possible_cost, 'total_cost')
-    model.Add(total_cost_var == sum(assignments[(i, j)] * costs[i][j]
-                                   for i in range(num_agents) for j in range(num_tasks)))
+    keys = [(i, j) for i in range(num_agents) for j in range(num_tasks)]
+    model.Add(total_cost_var == cp_model.LinearExpr.WeightedSum([assignments[key] for key in keys],
+                                                                [costs[i][j] for i, j in keys]))
+
+    # Warm start: tasks are independent (agents may take several), so the cheapest
+    # agent per task is already an optimal assignment
+    for j in range(num_tasks):
+        best_agent = min(range(num_agents), key=lambda i: costs[i][j])
+        for i in range(num_agents):
+            model.AddHint(assignments[(i, j)], i == best_agent)
 
     objective_is_minimized = False
     if problem.max_cost_target is not None:
@@ -42,7 +77,8 @@ def solve_task_assignment(problem: TaskAssignmentProblem) -> TaskAssignmentSolut
         objective_is_minimized = True
 
     # Solve the model
-    solver = cp_model.CpSolver()
+    if solver is None:
+        solver = default_solver()
     status = solver.Solve(model)
 
     solution_status: str = SolutionStatus.NOT_SOLVED
@@ -53,9 +89,10 @@ def solve_task_assignment(problem: TaskAssignmentProblem) -> TaskAssignmentSolut
         solution_status = SolutionStatus.OPTIMAL if status == cp_model.OPTIMAL else SolutionStatus.FEASIBLE
         total_cost = int(solver.ObjectiveValue()) if objective_is_minimized else int(solver.Value(total_cost_var))
 
+        values = solution_values(solver)
         for j in range(num_tasks):
             for i in range(num_agents):
-                if solver.Value(assignments[(i, j)]) == 1:
+                if values[assignments[(i, j)].Index()] == 1:
                     task_assignments[j] = i
                     break
 
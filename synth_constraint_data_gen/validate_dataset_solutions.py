@@ -1,6 +1,16 @@
-import pandas as pd
+import argparse
 import json
 import os
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterator, List, Tuple, TypeVar
+
+# orjson decodes in C; fall back to the stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from csp_cop_src.problems.job_shop_scheduling import JobShopSchedulingProblem
 from csp_cop_src.solutions.job_shop_scheduling_solution import JobShopSchedulingSolution
@@ -9,81 +19,167 @@ from csp_cop_src.solutions.base_solution import SolutionStatus # Needed for pote
 
 # Determine the absolute path to the directory containing this script
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-# Construct the absolute path to the data directory relative to this script
+# Construct the absolute path to the default data directory relative to this script
 # Data is in: <script_dir>/../data/llm_training_data/job_shop_scheduling/
 BASE_DATA_PATH = os.path.join(os.path.dirname(_SCRIPT_DIR), "data", "llm_training_data", "job_shop_scheduling")
 
-CSV_FILES = [
-    "jsp_full_test.csv",
-    "jsp_full_train.csv",
-    "jsp_full_val.csv",
-]
+# Split files validated in the data directory: create_dataset.py writes
+# <dataset_name>_<split>.parquet; older datasets were CSV
+SPLIT_FILE_SUFFIXES = (".parquet", ".csv")
+COLUMNS = ['problem', 'example_solution']
+
+NUM_WORKERS = os.cpu_count() # Rows are independent and CPU-bound
+ROW_CHUNKSIZE = 256 # Rows handed to a worker at once, amortizes pickling
+READ_BATCH_ROWS = 10_000 # Rows read from a split file at once, bounds memory on large files
+# Per worker process: many rows share a problem, and some repeat outright
+PROBLEM_CACHE_SIZE = 1024
+ROW_CACHE_SIZE = 4096
+
+# Per-row outcomes
+VALID = "valid"
+INVALID = "invalid"
+PARSE_ERROR = "parse_error"
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handlers below catch both
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+@lru_cache(maxsize=PROBLEM_CACHE_SIZE)
+def _parse_problem(problem_str: str) -> JobShopSchedulingProblem:
+    """Parses a problem JSON string once per distinct string; the problem is only read afterwards."""
+    return JobShopSchedulingProblem.from_dict(_json_loads(problem_str))
+
+@lru_cache(maxsize=ROW_CACHE_SIZE)
+def _validate_row(row: Tuple[str, str]) -> str:
+    """
+    Validates one (problem, example_solution) row in a worker process.
+    Returns VALID, INVALID or PARSE_ERROR; repeated rows hit the per-process cache.
+    """
+    problem_str, solution_str = row
+    # Empty cells come back as None (Parquet) or NaN (CSV): no JSON to parse
+    if not (isinstance(problem_str, str) and isinstance(solution_str, str)):
+        return PARSE_ERROR
+    try:
+        problem = _parse_problem(problem_str)
+        solution = JobShopSchedulingSolution.from_dict(_json_loads(solution_str))
+    except json.JSONDecodeError as e:
+        # print(f"  Error decoding JSON: {e}")
+        return PARSE_ERROR
+    except KeyError as e:
+        # print(f"  Missing expected key in problem/solution data: {e}")
+        return PARSE_ERROR
+    except (TypeError, ValueError) as e: # Wrongly shaped/typed data rejected by from_dict
+        # print(f"  Error processing problem/solution data: {e}")
+        return PARSE_ERROR
+    # Anything else raised here or by the validator is a bug, not bad data: let it surface
+
+    # Only the verdict is tallied: skip message formatting and stop at the first violation
+    is_valid, violations_count, error_details = validate_job_shop_solution(
+        problem, solution, collect_messages=False, fast_fail=True)
+
+    if is_valid:
+        return VALID
+    else:
+        # print(f"  Invalid solution for problem {problem.problem_id}.")
+        # print(f"    Violations: {violations_count}")
+        # print(f"    Details: {error_details}")
+        return INVALID
+
+class SplitReadError(Exception):
+    """A split file could not be read: I/O failure, malformed file or missing columns."""
+
+def _read_batches(file_path: str) -> Iterator[Tuple[list, list]]:
+    """
+    Streams (problems, example_solutions) column batches of a split file, reading
+    only those two columns and READ_BATCH_ROWS rows at a time.
+    Read and schema failures are raised as SplitReadError.
+    """
+    try:
+        if file_path.endswith(".parquet"):
+            import pyarrow.parquet as pq # Deferred like the other optional readers
+            for batch in pq.ParquetFile(file_path).iter_batches(batch_size=READ_BATCH_ROWS, columns=COLUMNS):
+                yield batch.column('problem').to_pylist(), batch.column('example_solution').to_pylist()
+        else:
+            import pandas as pd
+            for chunk in pd.read_csv(file_path, usecols=COLUMNS, chunksize=READ_BATCH_ROWS):
+                yield chunk['problem'].to_numpy(), chunk['example_solution'].to_numpy()
+    # pandas' ParserError/EmptyDataError and pyarrow's ArrowInvalid are ValueErrors,
+    # a missing column is a ValueError or KeyError, I/O failures are OSErrors
+    except (OSError, ValueError, KeyError) as e:
+        raise SplitReadError(str(e)) from e
+
+T = TypeVar("T")
+
+def _prefetched(iterator: Iterator[T], io_pool: Executor) -> Iterator[T]:
+    """
+    Yields the items of `iterator`, reading the next one on `io_pool` while the
+    caller is still working on the current one (e.g. file reading behind validation).
+    """
+    future = io_pool.submit(next, iterator, None)
+    while True:
+        item = future.result()
+        if item is None:
+            return
+        future = io_pool.submit(next, iterator, None)
+        yield item
 
 def main():
+    parser = argparse.ArgumentParser(description="Validate the example solutions of a generated JSSP dataset.")
+    parser.add_argument("--data_dir", type=str, default=BASE_DATA_PATH,
+                        help="Directory holding the split files (.parquet, or legacy .csv).")
+    args = parser.parse_args()
+
     overall_valid_count = 0
     overall_invalid_count = 0
     overall_error_parsing_count = 0 # Count entries that couldn't be parsed
 
-    for csv_file_name in CSV_FILES:
-        file_path = os.path.join(BASE_DATA_PATH, csv_file_name)
-        print(f"Processing file: {file_path}")
+    if not os.path.isdir(args.data_dir):
+        print(f"Error: Data directory not found at {args.data_dir}")
+        return
 
-        if not os.path.exists(file_path):
-            print(f"Error: File not found at {file_path}")
-            overall_error_parsing_count +=1 # Or a different counter for file not found
+    # Check every file once up front, so empty ones are reported before any work starts
+    split_paths: List[Tuple[str, str]] = []
+    for split_file_name in sorted(os.listdir(args.data_dir)):
+        if not split_file_name.endswith(SPLIT_FILE_SUFFIXES):
             continue
-
-        try:
-            df = pd.read_csv(file_path)
-        except Exception as e:
-            print(f"Error reading CSV {file_path}: {e}")
-            overall_error_parsing_count +=1
+        file_path = os.path.join(args.data_dir, split_file_name)
+        if not os.path.isfile(file_path):
             continue
-
-        file_valid_count = 0
-        file_invalid_count = 0
-        file_parsing_errors = 0
-
-        for index, row in df.iterrows():
+        if os.path.getsize(file_path) == 0:
+            print(f"Error: File is empty at {file_path}")
+            overall_error_parsing_count +=1
+        else:
+            split_paths.append((split_file_name, file_path))
+    if not split_paths:
+        print(f"Error: No {'/'.join(SPLIT_FILE_SUFFIXES)} split files found in {args.data_dir}")
+
+    # One thread reads batches ahead while the process pool validates the current one
+    with ProcessPoolExecutor(max_workers=NUM_WORKERS) as pool, ThreadPoolExecutor(max_workers=1) as io_pool:
+        for split_file_name, file_path in split_paths:
+            print(f"Processing file: {file_path}")
+
+            # Only read/schema failures are handled here: an exception from a worker is a
+            # bug and propagates. Rows validated before a read failure are still reported.
+            outcomes: Counter = Counter()
             try:
-                problem_dict = json.loads(row['problem'])
-                solution_dict = json.loads(row['example_solution'])
-
-                problem = JobShopSchedulingProblem.from_dict(problem_dict)
-                solution = JobShopSchedulingSolution.from_dict(solution_dict)
-
-                is_valid, violations_count, error_details = validate_job_shop_solution(problem, solution)
-
-                if is_valid:
-                    file_valid_count += 1
-                else:
-                    file_invalid_count += 1
-                    # print(f"  Row {index+2}: Invalid solution for problem {problem.problem_id}.")
-                    # print(f"    Violations: {violations_count}")
-                    # print(f"    Details: {error_details}")
-
-            except json.JSONDecodeError as e:
-                # print(f"  Row {index+2}: Error decoding JSON: {e}")
-                file_parsing_errors += 1
-            except KeyError as e:
-                # print(f"  Row {index+2}: Missing expected column (e.g., 'problem' or 'example_solution'): {e}")
-                file_parsing_errors += 1
-            except ValueError as e: # Catch ValueErrors from from_dict or validator
-                # print(f"  Row {index+2}: Error processing problem/solution data: {e}")
-                file_parsing_errors += 1
-            except Exception as e: # Catch-all for other unexpected errors
-                # print(f"  Row {index+2}: An unexpected error occurred: {e}")
-                file_parsing_errors += 1
-
-        print(f"Finished processing {csv_file_name}:")
-        print(f"  Valid solutions: {file_valid_count}")
-        print(f"  Invalid solutions: {file_invalid_count}")
-        print(f"  Rows with parsing/processing errors: {file_parsing_errors}")
-        print("-" * 30)
-
-        overall_valid_count += file_valid_count
-        overall_invalid_count += file_invalid_count
-        overall_error_parsing_count += file_parsing_errors
+                for problems, solutions in _prefetched(_read_batches(file_path), io_pool):
+                    outcomes.update(pool.map(_validate_row, zip(problems, solutions), chunksize=ROW_CHUNKSIZE))
+            except SplitReadError as e:
+                print(f"Error reading {file_path}: {e}")
+                overall_error_parsing_count +=1
+
+            file_valid_count = outcomes[VALID]
+            file_invalid_count = outcomes[INVALID]
+            file_parsing_errors = outcomes[PARSE_ERROR]
+
+            print(f"Finished processing {split_file_name}:")
+            print(f"  Valid solutions: {file_valid_count}")
+            print(f"  Invalid solutions: {file_invalid_count}")
+            print(f"  Rows with parsing/processing errors: {file_parsing_errors}")
+            print("-" * 30)
+
+            overall_valid_count += file_valid_count
+            overall_invalid_count += file_invalid_count
+            overall_error_parsing_count += file_parsing_errors
 
     print("\n" + "=" * 30)
     print("Overall Validation Summary:")
@@ -93,5 +189,5 @@ def main():
     print("=" * 30)
 
 if __name__ == "__main__":
-    # BASE_DATA_PATH is now defined globally and is absolute, so no complex path logic needed here.
+    # BASE_DATA_PATH is defined globally and is absolute; --data_dir overrides it.
     main()
@@ -18,11 +18,12 @@ Key rules
 
 from __future__ import annotations
 from collections import defaultdict
-from typing import Dict, List, Tuple, Any, Optional
+from itertools import islice
+from typing import Callable, Dict, List, Tuple, Any, Optional
 
 from csp_cop_src.problems.job_shop_scheduling import JobShopSchedulingProblem
 from csp_cop_src.solutions.base_solution import SolutionStatus
-from csp_cop_src.solutions.job_shop_scheduling_solution import JobShopSchedulingSolution
+from csp_cop_src.solutions.job_shop_scheduling_solution import JobShopSchedulingSolution, ScheduledTask
 
 # ---------------------------------------------------------------------------
 #  Import your own domain classes / enums here
@@ -47,157 +48,207 @@ def _as_dict(task: Any) -> Optional[Dict[str, Any]]:
     return None
 
 
-# ────────────────────────────────────────────────────────────────────────────
-#  Main validator
-# ────────────────────────────────────────────────────────────────────────────
-def validate_job_shop_solution(
-    problem: JobShopSchedulingProblem,
-    solution: JobShopSchedulingSolution,
-) -> Tuple[bool, Dict[str, int], List[str]]:
-    """
-    Validate `solution` against `problem`.
-
-    Returns
-    -------
-    is_valid : bool
-        True if the schedule satisfies every constraint (and ≤ makespan_target
-        when one is given).
-    violations : dict[str, int]
-        Count of each violation type.
-    error_details : list[str]
-        Human-readable messages (one per violation).
-    """
-    # ── containers ───────────────────────────────────────────────────────────
-    violations: Dict[str, int] = defaultdict(int)
-    error_details: List[str] = []
-    is_valid = True
+class _FailFast(Exception):
+    """Raised by the violation recorder to stop at the first fatal violation."""
 
-    def v(key: str, msg: str, fatal: bool = True):
-        """Register a violation."""
-        nonlocal is_valid
-        violations[key] += 1
-        error_details.append(msg)
-        if fatal:
-            is_valid = False
 
+def _check_schedule(
+    problem: JobShopSchedulingProblem,
+    solution: JobShopSchedulingSolution,
+    v: Callable[..., None],
+) -> None:
+    """Run every check, reporting each violation through `v(key, msg, fatal=True)`."""
     # ── early exit: INFEASIBLE path ──────────────────────────────────────────
     if solution.status == SolutionStatus.INFEASIBLE:
         if solution.schedule:
-            v("non_empty_infeasible", "INFEASIBLE solution contains a schedule.")
-        return is_valid, dict(violations), error_details
+            v("non_empty_infeasible", lambda: "INFEASIBLE solution contains a schedule.")
+        return
 
     # ── basic presence checks ───────────────────────────────────────────────
     if not solution.schedule:
-        v("empty_schedule", f"{solution.status.name} solution has no schedule.")
-        return is_valid, dict(violations), error_details
+        v("empty_schedule", lambda: f"{solution.status} solution has no schedule.")
+        return
 
     # ── per-machine container for overlap detection ─────────────────────────
     machine_ops: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
     task_end_times: List[int] = []
+    num_machines = problem.num_machines
 
     # ── iterate over jobs/tasks ──────────────────────────────────────────────
-    for j_idx, job in enumerate(problem.jobs):
+    # expected (machine_id, duration) per task, precomputed once per problem,
+    # so tasks are unpacked from tuples instead of read attribute by attribute
+    for j_idx, expected in enumerate(problem.parameters["jobs_description"]):
         sched_list = solution.schedule.get(j_idx)
         if sched_list is None:
-            v("missing_job", f"Job {j_idx} absent from schedule.")
+            v("missing_job", lambda: f"Job {j_idx} absent from schedule.")
             continue
 
-        # collect tasks by task_idx and detect duplicates
-        sched_by_idx: Dict[int, Dict[str, Any]] = {}
+        # collect (machine_id, start, end) by task_idx and detect duplicates;
+        # None marks an entry already reported as missing a key
+        sched_by_idx: Dict[int, Optional[Tuple[Any, Any, Any]]] = {}
         for raw in sched_list:
-            sd = _as_dict(raw)
-            if sd is None or "task_idx" not in sd:
-                v("malformed_task", f"Job {j_idx}: malformed task entry.")
-                continue
-            t_idx = sd["task_idx"]
+            if isinstance(raw, ScheduledTask):
+                # common case: read the slots directly, no dict round-trip
+                t_idx = raw.task_idx
+                entry = (raw.machine_id, raw.start, raw.end)
+            else:
+                sd = _as_dict(raw)
+                if sd is None or "task_idx" not in sd:
+                    v("malformed_task", lambda: f"Job {j_idx}: malformed task entry.")
+                    continue
+                t_idx = sd["task_idx"]
+                entry = None
+                for key in ("machine_id", "start", "end"):
+                    if key not in sd:
+                        v("malformed_task",
+                          lambda: f"Job {j_idx}, Task {t_idx} missing '{key}'.")
+                        break
+                else:
+                    entry = (sd["machine_id"], sd["start"], sd["end"])
             if t_idx in sched_by_idx:
-                v("duplicate_task_idx", f"Job {j_idx}: task_idx {t_idx} duplicated.")
-            sched_by_idx[t_idx] = sd
+                v("duplicate_task_idx", lambda: f"Job {j_idx}: task_idx {t_idx} duplicated.")
+            sched_by_idx[t_idx] = entry
 
         # task-count mismatch
-        if len(sched_by_idx) != len(job.tasks):
+        if len(sched_by_idx) != len(expected):
             v("task_count_mismatch",
-              f"Job {j_idx}: expected {len(job.tasks)} tasks, found {len(sched_by_idx)}.")
+              lambda: f"Job {j_idx}: expected {len(expected)} tasks, found {len(sched_by_idx)}.")
 
         # validate each task
-        for t_idx, ptask in enumerate(job.tasks):
-            sd = sched_by_idx.get(t_idx)
-            if sd is None:
+        for t_idx, (exp_machine, exp_duration) in enumerate(expected):
+            if t_idx not in sched_by_idx:
                 v("missing_task",
-                  f"Job {j_idx}, Task {t_idx} missing in schedule.")
+                  lambda: f"Job {j_idx}, Task {t_idx} missing in schedule.")
+                continue
+            entry = sched_by_idx[t_idx]
+            if entry is None:
                 continue
 
-            # required keys
-            for key in ("machine_id", "start", "end"):
-                if key not in sd:
-                    v("malformed_task",
-                      f"Job {j_idx}, Task {t_idx} missing '{key}'.")
-                    continue
+            m_id, start, end = entry
 
-            m_id, start, end = sd["machine_id"], sd["start"], sd["end"]
+            # common case: one combined test passes a well-formed task (durations are
+            # positive, so a matching duration also implies end > start); the detailed
+            # checks below only run to pinpoint what is wrong
+            if (type(m_id) is int and m_id == exp_machine and 0 <= m_id < num_machines
+                    and type(start) is int and type(end) is int
+                    and start >= 0 and end - start == exp_duration):
+                machine_ops[m_id].append((start, end))
+                task_end_times.append(end)
+                continue
 
             # machine id
-            if not isinstance(m_id, int) or not (0 <= m_id < problem.num_machines):
+            if not isinstance(m_id, int) or not (0 <= m_id < num_machines):
                 v("invalid_machine_id",
-                  f"Job {j_idx}, Task {t_idx}: machine_id {m_id} out of range.")
+                  lambda: f"Job {j_idx}, Task {t_idx}: machine_id {m_id} out of range.")
             # machine mismatch
-            if m_id != ptask.machine_id:
+            if m_id != exp_machine:
                 v("machine_mismatch",
-                  f"Job {j_idx}, Task {t_idx}: expected M{ptask.machine_id}, got M{m_id}.")
+                  lambda: f"Job {j_idx}, Task {t_idx}: expected M{exp_machine}, got M{m_id}.")
 
             # time sanity
             if not all(isinstance(x, int) for x in (start, end)):
                 v("non_integer_time",
-                  f"Job {j_idx}, Task {t_idx}: start/end not integers.")
+                  lambda: f"Job {j_idx}, Task {t_idx}: start/end not integers.")
+                sched_by_idx[t_idx] = None  # keep it out of the precedence check below
                 continue
             if start < 0:
                 v("negative_start",
-                  f"Job {j_idx}, Task {t_idx}: start {start} < 0.")
+                  lambda: f"Job {j_idx}, Task {t_idx}: start {start} < 0.")
             if end <= start:
                 v("non_positive_duration",
-                  f"Job {j_idx}, Task {t_idx}: end {end} ≤ start {start}.")
-            if end - start != ptask.duration:
+                  lambda: f"Job {j_idx}, Task {t_idx}: end {end} ≤ start {start}.")
+            if end - start != exp_duration:
                 v("duration_mismatch",
-                  f"Job {j_idx}, Task {t_idx}: "
-                  f"duration should be {ptask.duration}, got {end-start}.")
+                  lambda: f"Job {j_idx}, Task {t_idx}: "
+                  f"duration should be {exp_duration}, got {end-start}.")
 
             # collect for later checks
             machine_ops[m_id].append((start, end))
             task_end_times.append(end)
 
-        # precedence (task i must finish before i+1 starts)
-        for i in range(len(job.tasks) - 1):
-            first = sched_by_idx.get(i)
+        # precedence (task i must finish before i+1 starts); carry the
+        # previous entry forward so each task is looked up once
+        first = sched_by_idx.get(0)
+        for i in range(len(expected) - 1):
             second = sched_by_idx.get(i + 1)
-            if first and second and first["end"] > second["start"]:
+            if first and second and first[2] > second[1]:
                 v("precedence_violation",
-                  f"Job {j_idx}: Task {i} ends {first['end']} "
-                  f"after Task {i+1} starts {second['start']}.")
+                  lambda: f"Job {j_idx}: Task {i} ends {first[2]} "
+                  f"after Task {i+1} starts {second[1]}.")
+            first = second
 
     # ── machine overlap check ───────────────────────────────────────────────
     for m_id, ops in machine_ops.items():
         if len(ops) < 2:
             continue
         ops.sort()  # sort by start
-        for (s1, e1), (s2, e2) in zip(ops, ops[1:]):
+        for (s1, e1), (s2, e2) in zip(ops, islice(ops, 1, None)):
             if e1 > s2:
                 v("machine_overlap",
-                  f"Machine {m_id}: [{s1},{e1}) overlaps [{s2},{e2}).")
+                  lambda: f"Machine {m_id}: [{s1},{e1}) overlaps [{s2},{e2}).")
                 break  # one is enough
 
     # ── makespan checks ──────────────────────────────────────────────────────
     calc_ms: Optional[int] = max(task_end_times) if task_end_times else None
     if calc_ms is None:
-        v("no_valid_times", "No valid start/end times found in schedule.")
+        v("no_valid_times", lambda: "No valid start/end times found in schedule.")
     else:
         # compare with reported solution.makespan
         if solution.makespan is not None and solution.makespan != calc_ms:
             v("makespan_mismatch",
-              f"Solution.makespan {solution.makespan} ≠ calculated {calc_ms}.")
+              lambda: f"Solution.makespan {solution.makespan} ≠ calculated {calc_ms}.")
         # compare with problem.makespan_target if present
         if problem.makespan_target is not None and calc_ms > problem.makespan_target:
             v("target_makespan_exceeded",
-              f"Makespan {calc_ms} exceeds target {problem.makespan_target}.")
+              lambda: f"Makespan {calc_ms} exceeds target {problem.makespan_target}.")
+
+
+# ────────────────────────────────────────────────────────────────────────────
+#  Main validator
+# ────────────────────────────────────────────────────────────────────────────
+def validate_job_shop_solution(
+    problem: JobShopSchedulingProblem,
+    solution: JobShopSchedulingSolution,
+    collect_messages: bool = True,
+    fast_fail: bool = False,
+) -> Tuple[bool, Dict[str, int], List[str]]:
+    """
+    Validate `solution` against `problem`.
+    Pass `collect_messages=False` when only the verdict/counts are needed:
+    messages are then never formatted and `error_details` is empty.
+    Pass `fast_fail=True` to stop at the first fatal violation; the returned
+    counts/messages then only cover the checks run up to that point.
+
+    Returns
+    -------
+    is_valid : bool
+        True if the schedule satisfies every constraint (and ≤ makespan_target
+        when one is given).
+    violations : dict[str, int]
+        Count of each violation type.
+    error_details : list[str]
+        Human-readable messages (one per violation).
+    """
+    # ── containers ───────────────────────────────────────────────────────────
+    violations: Dict[str, int] = defaultdict(int)
+    error_details: List[str] = []
+    is_valid = True
+
+    def v(key: str, msg: Callable[[], str], fatal: bool = True):
+        """Register a violation; `msg` builds its message, only called when collecting."""
+        nonlocal is_valid
+        violations[key] += 1
+        if collect_messages:
+            error_details.append(msg())
+        if fatal:
+            is_valid = False
+            if fast_fail:
+                raise _FailFast
+
+    try:
+        _check_schedule(problem, solution, v)
+    except _FailFast:
+        pass
 
     # ── final verdict ────────────────────────────────────────────────────────
     return is_valid, dict(violations), error_details
\ No newline at end of file